@@ -6,18 +6,24 @@ including dependency injection, routing, HTTP handling, database ORM,
 authentication, middleware, and more.
 """
 
-# Core Phase 1 components
-from larapy.core.application import Application
-from larapy.routing.route import Route
-from larapy.http.request import Request
-from larapy.http.response import Response
+import importlib
 
-# Phase 2 Database components
-from larapy.database import DatabaseManager, Schema
-from larapy.orm import Model
-
-# Phase 2 Auth components (when implemented)
-# from larapy.auth import AuthManager
+# Public components are imported on first attribute access so that light
+# entry points (e.g. the ``larapy`` CLI) do not pull in the web stack,
+# SQLAlchemy and the ORM just by importing a larapy submodule.
+_LAZY_IMPORTS = {
+    # Core Phase 1 components
+    "Application": "larapy.core.application",
+    "Route": "larapy.routing.route",
+    "Request": "larapy.http.request",
+    "Response": "larapy.http.response",
+    # Phase 2 Database components
+    "DatabaseManager": "larapy.database",
+    "Schema": "larapy.database",
+    "Model": "larapy.orm",
+    # Phase 2 Auth components (when implemented)
+    # "AuthManager": "larapy.auth",
+}
 
 __version__ = "0.2.0"
 __author__ = "Larapy Team"
@@ -33,4 +39,20 @@ __all__ = [
     "DatabaseManager",
     "Schema",
     "Model",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import public components lazily on first access."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported components in dir(larapy)."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
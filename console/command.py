@@ -7,7 +7,14 @@ This module provides the base command class for CLI commands.
 import sys
 import argparse
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, ClassVar, Dict, Iterable, List
+
+
+# Message prefixes for the output helpers
+_INFO_PREFIX = "ℹ️  "
+_WARNING_PREFIX = "⚠️  "
+_ERROR_PREFIX = "❌ "
+_SUCCESS_PREFIX = "✅ "
 
 
 class Command(ABC):
@@ -16,14 +23,52 @@ class Command(ABC):
     name: str = ""
     description: str = ""
     
+    # Configured parsers shared by every instance of a command class
+    _parser_cache: ClassVar[Dict[type, argparse.ArgumentParser]] = {}
+    
     def __init__(self):
-        self.parser = argparse.ArgumentParser(
-            prog=self.name,
-            description=self.description
+        cls = type(self)
+        parser = self._parser_cache.get(cls)
+        if parser is None:
+            parser = self._parser_cache[cls] = cls._build_parser()
+        
+        self.parser = parser
+        self._owns_parser = False
+    
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """
+        Register the command's arguments.
+        
+        Called once per command class; the resulting parser is shared by
+        all instances of that class.
+        
+        Args:
+            parser: Parser to add arguments to
+        """
+        pass
+    
+    @classmethod
+    def _build_parser(cls) -> argparse.ArgumentParser:
+        """Build a parser for this command class."""
+        parser = argparse.ArgumentParser(
+            prog=cls.name,
+            description=cls.description
         )
+        cls.configure_parser(parser)
+        return parser
     
     def add_argument(self, *args, **kwargs):
-        """Add an argument to the command parser."""
+        """
+        Add an argument to this instance's parser.
+        
+        Prefer configure_parser(); the first call here gives the instance its
+        own parser so the shared one is left untouched.
+        """
+        if not self._owns_parser:
+            self.parser = self._build_parser()
+            self._owns_parser = True
+        
         return self.parser.add_argument(*args, **kwargs)
     
     def parse_args(self, args: List[str] = None) -> Dict[str, Any]:
@@ -46,16 +91,20 @@ class Command(ABC):
     
     def info(self, message: str):
         """Print an info message."""
-        print(f"ℹ️  {message}")
+        sys.stdout.write(f"{_INFO_PREFIX}{message}\n")
+    
+    def info_many(self, messages: Iterable[str]):
+        """Print several info messages with a single write."""
+        sys.stdout.write(''.join(f"{_INFO_PREFIX}{message}\n" for message in messages))
     
     def warning(self, message: str):
         """Print a warning message."""
-        print(f"⚠️  {message}")
+        sys.stdout.write(f"{_WARNING_PREFIX}{message}\n")
     
     def error(self, message: str):
         """Print an error message."""
-        print(f"❌ {message}", file=sys.stderr)
+        sys.stderr.write(f"{_ERROR_PREFIX}{message}\n")
     
     def success(self, message: str):
         """Print a success message."""
-        print(f"✅ {message}")
\ No newline at end of file
+        sys.stdout.write(f"{_SUCCESS_PREFIX}{message}\n")
\ No newline at end of file
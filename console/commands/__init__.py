@@ -0,0 +1,3 @@
+"""Click command groups and command classes for the Larapy CLI."""
+
+__all__ = []
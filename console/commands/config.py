@@ -0,0 +1,91 @@
+"""
+Configuration Commands (larapy config)
+
+Click commands for caching, clearing and showing application configuration.
+"""
+
+import click
+from ..cli import LarapyGroup
+
+
+@click.group('config', cls=LarapyGroup, short_help='Configuration management commands.')
+def config_cmd():
+    """Configuration management commands."""
+    pass
+
+
+# =============================================================================
+# CONFIGURATION COMMANDS (larapy config)
+# =============================================================================
+
+@config_cmd.command('cache', short_help='Cache configuration for better performance.')
+def config_cache():
+    """Cache configuration for better performance."""
+    try:
+        import sys
+        from pathlib import Path
+        
+        # Add package to path
+        sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+        
+        from core.helpers import cache_config
+        
+        click.echo("📦 Caching configuration...")
+        cache_config()
+        click.echo("✅ Configuration cached successfully.")
+        
+    except Exception as e:
+        click.echo(f"❌ Configuration caching failed: {str(e)}")
+
+
+@config_cmd.command('clear', short_help='Clear cached configuration.')
+def config_clear():
+    """Clear cached configuration."""
+    try:
+        import sys
+        from pathlib import Path
+        
+        # Add package to path
+        sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+        
+        from core.helpers import clear_config_cache
+        
+        click.echo("🗑️  Clearing configuration cache...")
+        clear_config_cache()
+        click.echo("✅ Configuration cache cleared.")
+        
+    except Exception as e:
+        click.echo(f"❌ Configuration cache clearing failed: {str(e)}")
+
+
+@config_cmd.command('show', short_help='Show configuration values.')
+@click.argument('key', required=False)
+def config_show(key: str):
+    """Show configuration values."""
+    try:
+        import sys
+        from pathlib import Path
+        
+        # Add package to path
+        sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+        
+        from core.helpers import config
+        
+        if key:
+            value = config(key)
+            if value is not None:
+                click.echo(f"{key}: {value}")
+            else:
+                click.echo(f"❌ Configuration key '{key}' not found.")
+        else:
+            # Show all configuration
+            all_config = config()
+            if all_config:
+                import json
+                click.echo("📋 Current Configuration:")
+                click.echo(json.dumps(all_config, indent=2, default=str))
+            else:
+                click.echo("❌ No configuration found.")
+        
+    except Exception as e:
+        click.echo(f"❌ Failed to show configuration: {str(e)}")
@@ -8,6 +8,7 @@ Provides CLI commands for advanced configuration management including:
 - Managing encrypted values
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -28,12 +29,13 @@ class ConfigPublishCommand(Command):
     name = "config:publish"
     description = "Publish configuration files from packages"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('package', help='Package name to publish config from')
-        self.add_argument('--force', action='store_true', 
-                         help='Overwrite existing configuration files')
-        self.add_argument('--tag', help='Specific configuration tag to publish')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('package', help='Package name to publish config from')
+        parser.add_argument('--force', action='store_true', 
+                           help='Overwrite existing configuration files')
+        parser.add_argument('--tag', help='Specific configuration tag to publish')
     
     def handle(self, **options):
         """Handle the config:publish command."""
@@ -98,11 +100,12 @@ class ConfigBackupCommand(Command):
     name = "config:backup"
     description = "Create a backup of configuration files"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('--name', help='Backup name (defaults to timestamp)')
-        self.add_argument('--configs', nargs='*', 
-                         help='Specific configuration files to backup')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('--name', help='Backup name (defaults to timestamp)')
+        parser.add_argument('--configs', nargs='*', 
+                           help='Specific configuration files to backup')
     
     def handle(self, **options):
         """Handle the config:backup command."""
@@ -141,11 +144,12 @@ class ConfigRestoreCommand(Command):
     name = "config:restore"
     description = "Restore configuration files from backup"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('backup_name', help='Name of backup to restore')
-        self.add_argument('--no-verify', action='store_true',
-                         help='Skip checksum verification')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('backup_name', help='Name of backup to restore')
+        parser.add_argument('--no-verify', action='store_true',
+                           help='Skip checksum verification')
     
     def handle(self, **options):
         """Handle the config:restore command."""
@@ -217,10 +221,11 @@ class ConfigValidateCommand(Command):
     name = "config:validate"
     description = "Validate configuration files against schemas"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('configs', nargs='*', 
-                         help='Specific configuration files to validate')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('configs', nargs='*', 
+                           help='Specific configuration files to validate')
     
     def handle(self, **options):
         """Handle the config:validate command."""
@@ -267,10 +272,11 @@ class ConfigEncryptCommand(Command):
     name = "config:encrypt"
     description = "Encrypt sensitive configuration values"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('config', help='Configuration file name')
-        self.add_argument('keys', nargs='+', help='Keys to encrypt')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('config', help='Configuration file name')
+        parser.add_argument('keys', nargs='+', help='Keys to encrypt')
     
     def handle(self, **options):
         """Handle the config:encrypt command."""
@@ -302,8 +308,7 @@ class ConfigEncryptCommand(Command):
             config_manager.save_config(config_name, config, existing_keys)
             
             self.info(f"Encrypted {len(existing_keys)} keys in {config_name}")
-            for key in existing_keys:
-                self.info(f"  - {key}")
+            self.info_many(f"  - {key}" for key in existing_keys)
                 
         except Exception as e:
             self.error(f"Error encrypting configuration: {e}")
@@ -315,10 +320,11 @@ class ConfigDecryptCommand(Command):
     name = "config:decrypt"
     description = "Decrypt and display configuration values"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('config', help='Configuration file name')
-        self.add_argument('keys', nargs='*', help='Specific keys to decrypt (all if none specified)')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('config', help='Configuration file name')
+        parser.add_argument('keys', nargs='*', help='Specific keys to decrypt (all if none specified)')
     
     def handle(self, **options):
         """Handle the config:decrypt command."""
@@ -361,12 +367,13 @@ class ConfigHotReloadCommand(Command):
     name = "config:hot-reload"
     description = "Enable or disable configuration hot-reloading"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('action', choices=['enable', 'disable'], 
-                         help='Action to perform')
-        self.add_argument('--configs', nargs='*',
-                         help='Configuration files to watch (all if none specified)')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('action', choices=['enable', 'disable'], 
+                           help='Action to perform')
+        parser.add_argument('--configs', nargs='*',
+                           help='Configuration files to watch (all if none specified)')
     
     def handle(self, **options):
         """Handle the config:hot-reload command."""
@@ -414,14 +421,15 @@ class ConfigMergeCommand(Command):
     name = "config:merge"
     description = "Merge configuration files with package overrides"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('base_config', help='Base configuration name')
-        self.add_argument('--packages', nargs='*', 
-                         help='Package configurations to merge')
-        self.add_argument('--output', help='Output merged configuration to file')
-        self.add_argument('--dry-run', action='store_true',
-                         help='Show merge result without saving')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('base_config', help='Base configuration name')
+        parser.add_argument('--packages', nargs='*', 
+                           help='Package configurations to merge')
+        parser.add_argument('--output', help='Output merged configuration to file')
+        parser.add_argument('--dry-run', action='store_true',
+                           help='Show merge result without saving')
     
     def handle(self, **options):
         """Handle the config:merge command."""
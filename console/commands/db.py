@@ -0,0 +1,391 @@
+"""
+Database Commands (larapy db)
+
+Click commands for managing and inspecting the application database.
+"""
+
+import click
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+from ..cli import LarapyGroup
+from .migrate import run, rollback, fresh, status, _get_migrator
+
+
+@click.group(cls=LarapyGroup, short_help='Database management commands.')
+def db():
+    """Database management commands."""
+    pass
+
+
+# =============================================================================
+# DATABASE COMMANDS (larapy db)
+# =============================================================================
+
+@db.command('migrate', short_help='Run database migrations.')
+@click.option('--seed', is_flag=True, help='Seed the database after migrating')
+@click.option('--force', is_flag=True, help='Force the migration in production')
+def db_migrate(seed: bool, force: bool):
+    """Run database migrations."""
+    ctx = click.get_current_context()
+    ctx.invoke(run, seed=seed, force=force, pretend=False, step=None)
+
+
+@db.command('rollback', short_help='Rollback database migrations.')
+@click.option('--step', type=int, default=1, help='Number of migration batches to rollback')
+@click.option('--force', is_flag=True, help='Force the rollback in production')
+def db_rollback(step: int, force: bool):
+    """Rollback database migrations."""
+    ctx = click.get_current_context()
+    ctx.invoke(rollback, step=step, force=force, pretend=False)
+
+
+@db.command('fresh', short_help='Drop all tables and re-run all migrations.')
+@click.option('--seed', is_flag=True, help='Seed the database after fresh migration')
+@click.option('--force', is_flag=True, help='Force the operation in production')
+def db_fresh(seed: bool, force: bool):
+    """Drop all tables and re-run all migrations."""
+    ctx = click.get_current_context()
+    ctx.invoke(fresh, seed=seed, force=force)
+
+
+@db.command('status', short_help='Show migration status.')
+@click.option('--json', 'as_json', is_flag=True, help='Output in JSON format')
+def db_status(as_json: bool):
+    """Show migration status."""
+    if not as_json:
+        ctx = click.get_current_context()
+        ctx.invoke(status, verbose=False, pending=False, executed=False)
+        return
+    
+    try:
+        migrator = _get_migrator()
+        click.echo(_dumps_json(migrator.status()))
+        
+    except Exception as e:
+        click.echo(_dumps_json({'error': f"Status check failed: {str(e)}"}))
+
+
+@db.command('seed', short_help='Run database seeders.')
+@click.argument('seeder', required=False)
+@click.option('--class', 'seeder_class', help='The class name of the root seeder')
+def db_seed(seeder: str, seeder_class: str):
+    """Run database seeders."""
+    try:
+        # TODO: Implement seeder runner
+        seeder_name = seeder or seeder_class or 'DatabaseSeeder'
+        click.echo(f"🌱 Running seeder: {seeder_name}")
+        click.echo("✅ Seeding completed.")
+        
+    except Exception as e:
+        click.echo(f"❌ Seeding failed: {str(e)}")
+
+
+@db.command('inspect', short_help='Inspect database structure.')
+@click.option('--table', help='Specific table to inspect')
+@click.option('--show-data', is_flag=True, help='Show sample data from tables')
+@click.option('--json', 'as_json', is_flag=True, help='Output in JSON format')
+def db_inspect(table: str, show_data: bool, as_json: bool):
+    """Inspect database structure."""
+    try:
+        migrator = _get_migrator()
+        
+        with migrator.get_connection() as conn:
+            if as_json:
+                click.echo(_dumps_json(_inspect_payload(conn, table, show_data)))
+            elif table:
+                click.echo(f"🔍 Inspecting table: {table}")
+                click.echo("─" * 50)
+                
+                # Check if table exists
+                cursor = conn.execute('''
+                    SELECT name FROM sqlite_master 
+                    WHERE type='table' AND name=?
+                ''', (table,))
+                
+                if not cursor.fetchone():
+                    click.echo(f"❌ Table '{table}' not found")
+                    return
+                
+                # Show table structure
+                cursor = conn.execute(f"PRAGMA table_info({table})")
+                columns = cursor.fetchall()
+                
+                click.echo("Columns:")
+                for col in columns:
+                    pk_marker = " (PK)" if col[5] else ""
+                    nullable = "NULL" if not col[3] else "NOT NULL"
+                    default = f" DEFAULT: {col[4]}" if col[4] else ""
+                    click.echo(f"  • {col[1]} - {col[2]} {nullable}{default}{pk_marker}")
+                
+                # Show row count
+                cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")
+                count = cursor.fetchone()[0]
+                click.echo(f"\nRow count: {count}")
+                
+                # Show sample data if requested
+                if show_data and count > 0:
+                    cursor = conn.execute(f"SELECT * FROM {table} LIMIT 5")
+                    rows = cursor.fetchall()
+                    if rows:
+                        click.echo("\nSample data (first 5 rows):")
+                        column_names = [col[1] for col in columns]
+                        
+                        # Print header
+                        header = " | ".join(f"{name:15}" for name in column_names)
+                        click.echo(f"  {header}")
+                        click.echo(f"  {'-' * len(header)}")
+                        
+                        # Print rows
+                        for row in rows:
+                            row_str = " | ".join(f"{str(val):15}" for val in row)
+                            click.echo(f"  {row_str}")
+            else:
+                # Show all tables
+                click.echo("🔍 Database Tables:")
+                click.echo("─" * 30)
+                
+                tables = _inspect_all_tables(conn)
+                if not tables:
+                    click.echo("No tables found.")
+                    return
+                
+                for table_name, count in tables:
+                    click.echo(f"  • {table_name} ({count} rows)")
+        
+    except Exception as e:
+        if as_json:
+            click.echo(_dumps_json({'error': f"Inspection failed: {str(e)}"}))
+        else:
+            click.echo(f"❌ Inspection failed: {str(e)}")
+
+
+@contextmanager
+def _read_transaction(conn):
+    """
+    Run a sequence of SQLite reads inside one deferred transaction.
+    
+    Holds a single shared lock for the whole sequence instead of acquiring
+    and releasing one per statement in autocommit mode.
+    """
+    if conn.in_transaction:
+        yield conn
+        return
+    
+    conn.execute("BEGIN DEFERRED")
+    try:
+        yield conn
+    finally:
+        conn.execute("COMMIT")
+
+
+def _inspect_all_tables(conn) -> list:
+    """Return (table_name, row_count) pairs for every table in the database."""
+    with _read_transaction(conn):
+        cursor = conn.execute('''
+            SELECT name FROM sqlite_master 
+            WHERE type='table' 
+            ORDER BY name
+        ''')
+        table_names = [row[0] for row in cursor.fetchall()]
+        
+        return [
+            (table_name, conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0])
+            for table_name in table_names
+        ]
+
+
+def _dumps_json(payload: Any) -> str:
+    """Serialize a payload as indented JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(payload, indent=2, default=str)
+    
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=str).decode()
+
+
+def _table_exists(conn, table: str) -> bool:
+    """Check whether a table exists in the SQLite database."""
+    cursor = conn.execute('''
+        SELECT name FROM sqlite_master 
+        WHERE type='table' AND name=?
+    ''', (table,))
+    return cursor.fetchone() is not None
+
+
+def _table_columns(conn, table: str) -> List[Dict[str, Any]]:
+    """Describe a table's columns from PRAGMA table_info."""
+    return [
+        {
+            'name': col[1],
+            'type': col[2],
+            'nullable': not col[3],
+            'default': col[4],
+            'primary_key': bool(col[5]),
+        }
+        for col in conn.execute(f"PRAGMA table_info({table})").fetchall()
+    ]
+
+
+def _inspect_payload(conn, table: Optional[str], show_data: bool) -> Dict[str, Any]:
+    """Build the machine-readable payload for 'db inspect --json'."""
+    if not table:
+        return {
+            'tables': [
+                {'name': table_name, 'rows': count}
+                for table_name, count in _inspect_all_tables(conn)
+            ]
+        }
+    
+    with _read_transaction(conn):
+        if not _table_exists(conn, table):
+            return {'error': f"Table '{table}' not found"}
+        
+        payload = {
+            'table': table,
+            'columns': _table_columns(conn, table),
+            'rows': conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0],
+        }
+        
+        if show_data and payload['rows'] > 0:
+            cursor = conn.execute(f"SELECT * FROM {table} LIMIT 5")
+            payload['sample'] = [list(row) for row in cursor.fetchall()]
+    
+    return payload
+
+
+def _schema_payload(conn, table: Optional[str]) -> Dict[str, Any]:
+    """Build the machine-readable payload for 'db schema --json'."""
+    with _read_transaction(conn):
+        if table:
+            cursor = conn.execute('''
+                SELECT name, sql FROM sqlite_master 
+                WHERE type='table' AND name=?
+            ''', (table,))
+        else:
+            cursor = conn.execute('''
+                SELECT name, sql FROM sqlite_master 
+                WHERE type='table' 
+                ORDER BY name
+            ''')
+        
+        tables = [
+            {'name': table_name, 'sql': sql, 'columns': _table_columns(conn, table_name)}
+            for table_name, sql in cursor.fetchall()
+        ]
+    
+    if table and not tables:
+        return {'error': f"Table '{table}' not found"}
+    
+    return {'tables': tables}
+
+
+@db.command('schema', short_help='Show database schema.')
+@click.option('--table', help='Show schema for specific table')
+@click.option('--output', type=click.Choice(['table', 'sql']), default='table', help='Output format')
+@click.option('--json', 'as_json', is_flag=True, help='Output in JSON format')
+def db_schema(table: str, output: str, as_json: bool):
+    """Show database schema."""
+    try:
+        migrator = _get_migrator()
+        
+        with migrator.get_connection() as conn:
+            if as_json:
+                click.echo(_dumps_json(_schema_payload(conn, table)))
+            elif table:
+                click.echo(f"📋 Schema for table: {table}")
+                
+                if output == 'sql':
+                    cursor = conn.execute('''
+                        SELECT sql FROM sqlite_master 
+                        WHERE type='table' AND name=?
+                    ''', (table,))
+                    result = cursor.fetchone()
+                    if result:
+                        click.echo(result[0])
+                    else:
+                        click.echo(f"❌ Table '{table}' not found")
+                else:
+                    # Show table info in formatted way
+                    cursor = conn.execute(f"PRAGMA table_info({table})")
+                    columns = cursor.fetchall()
+                    
+                    if columns:
+                        click.echo("─" * 60)
+                        click.echo(f"{'Column':<20} {'Type':<15} {'Null':<8} {'Default':<15}")
+                        click.echo("─" * 60)
+                        
+                        for col in columns:
+                            null_str = "YES" if col[3] == 0 else "NO"
+                            default_str = str(col[4]) if col[4] else ""
+                            click.echo(f"{col[1]:<20} {col[2]:<15} {null_str:<8} {default_str:<15}")
+                    else:
+                        click.echo(f"❌ Table '{table}' not found")
+            else:
+                # Show all tables schema
+                click.echo("📋 Database Schema")
+                click.echo("─" * 40)
+                
+                with _read_transaction(conn):
+                    cursor = conn.execute('''
+                        SELECT name, sql FROM sqlite_master 
+                        WHERE type='table' 
+                        ORDER BY name
+                    ''')
+                    
+                    for row in cursor.fetchall():
+                        table_name, sql = row
+                        click.echo(f"\n{table_name}:")
+                        if output == 'sql':
+                            click.echo(sql)
+                        else:
+                            # Show simplified schema
+                            cursor2 = conn.execute(f"PRAGMA table_info({table_name})")
+                            columns = cursor2.fetchall()
+                            for col in columns:
+                                pk_str = " (PK)" if col[5] else ""
+                                click.echo(f"  • {col[1]} {col[2]}{pk_str}")
+        
+    except Exception as e:
+        if as_json:
+            click.echo(_dumps_json({'error': f"Schema display failed: {str(e)}"}))
+        else:
+            click.echo(f"❌ Schema display failed: {str(e)}")
+
+
+@db.command('wipe', short_help='Wipe all tables from the database.')
+@click.option('--drop-views', is_flag=True, help='Drop all database views')
+@click.option('--drop-types', is_flag=True, help='Drop all user-defined types')
+@click.option('--keep-migrations', is_flag=True, help='Keep the migrations table')
+@click.option('--force', is_flag=True, help='Force the operation')
+def db_wipe(drop_views: bool, drop_types: bool, keep_migrations: bool, force: bool):
+    """Wipe all tables from the database."""
+    try:
+        migrator = _get_migrator()
+        
+        click.echo("🗑️  Wiping database...")
+        
+        with migrator.get_connection() as conn:
+            # Get all tables
+            cursor = conn.execute('''
+                SELECT name FROM sqlite_master 
+                WHERE type='table'
+            ''')
+            tables = [row[0] for row in cursor.fetchall()]
+            
+            dropped_count = 0
+            for table_name in tables:
+                if keep_migrations and table_name == 'migrations':
+                    continue
+                    
+                conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+                dropped_count += 1
+                click.echo(f"  Dropped table: {table_name}")
+            
+            conn.commit()
+            
+            click.echo(f"✅ Wiped {dropped_count} tables from database.")
+        
+    except Exception as e:
+        click.echo(f"❌ Database wipe failed: {str(e)}")
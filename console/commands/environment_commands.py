@@ -4,6 +4,7 @@ Environment Management CLI Commands
 Provides CLI commands for environment management and setup.
 """
 
+import argparse
 import json
 import sys
 from typing import Dict, Any
@@ -19,12 +20,13 @@ class EnvironmentStatusCommand(Command):
     name = "env:status"
     description = "Display current environment status and configuration"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('--json', action='store_true', 
-                         help='Output in JSON format')
-        self.add_argument('--validation', action='store_true',
-                         help='Include validation details')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('--json', action='store_true', 
+                           help='Output in JSON format')
+        parser.add_argument('--validation', action='store_true',
+                           help='Include validation details')
     
     def handle(self, **options):
         """Handle the env:status command."""
@@ -90,17 +92,18 @@ class EnvironmentInitCommand(Command):
     name = "env:init"
     description = "Initialize a new environment configuration"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('environment', help='Environment name to initialize')
-        self.add_argument('--force', action='store_true',
-                         help='Overwrite existing configuration')
-        self.add_argument('--no-deps', action='store_true',
-                         help='Skip dependency installation')
-        self.add_argument('--no-db', action='store_true',
-                         help='Skip database initialization')
-        self.add_argument('--template-vars', nargs='*',
-                         help='Template variables in key=value format')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('environment', help='Environment name to initialize')
+        parser.add_argument('--force', action='store_true',
+                           help='Overwrite existing configuration')
+        parser.add_argument('--no-deps', action='store_true',
+                           help='Skip dependency installation')
+        parser.add_argument('--no-db', action='store_true',
+                           help='Skip database initialization')
+        parser.add_argument('--template-vars', nargs='*',
+                           help='Template variables in key=value format')
     
     def handle(self, **options):
         """Handle the env:init command."""
@@ -117,11 +120,10 @@ class EnvironmentInitCommand(Command):
             
             # Parse template variables
             template_vars = {}
-            if options.get('template_vars'):
-                for var in options['template_vars']:
-                    if '=' in var:
-                        key, value = var.split('=', 1)
-                        template_vars[key.strip()] = value.strip()
+            for var in options.get('template_vars') or ():
+                if '=' in var:
+                    key, value = var.split('=', 1)
+                    template_vars[key.strip()] = value.strip()
             
             # Setup configuration
             config = {
@@ -157,11 +159,12 @@ class EnvironmentSwitchCommand(Command):
     name = "env:switch"
     description = "Switch to a different environment"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('environment', help='Environment name to switch to')
-        self.add_argument('--backup', action='store_true',
-                         help='Backup current environment before switching')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('environment', help='Environment name to switch to')
+        parser.add_argument('--backup', action='store_true',
+                           help='Backup current environment before switching')
     
     def handle(self, **options):
         """Handle the env:switch command."""
@@ -214,10 +217,11 @@ class EnvironmentListCommand(Command):
     name = "env:list"
     description = "List all available environments"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('--details', action='store_true',
-                         help='Show detailed information for each environment')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('--details', action='store_true',
+                           help='Show detailed information for each environment')
     
     def handle(self, **options):
         """Handle the env:list command."""
@@ -263,12 +267,13 @@ class EnvironmentValidateCommand(Command):
     name = "env:validate"
     description = "Validate environment variable configuration"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('environment', nargs='?', 
-                         help='Environment to validate (current if not specified)')
-        self.add_argument('--fix', action='store_true',
-                         help='Attempt to fix validation issues')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('environment', nargs='?', 
+                           help='Environment to validate (current if not specified)')
+        parser.add_argument('--fix', action='store_true',
+                           help='Attempt to fix validation issues')
     
     def handle(self, **options):
         """Handle the env:validate command."""
@@ -341,12 +346,13 @@ class EnvironmentExportCommand(Command):
     name = "env:export"
     description = "Export environment configuration to a file"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('environment', help='Environment to export')
-        self.add_argument('output_file', help='Output file path')
-        self.add_argument('--include-secrets', action='store_true',
-                         help='Include sensitive values in export')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('environment', help='Environment to export')
+        parser.add_argument('output_file', help='Output file path')
+        parser.add_argument('--include-secrets', action='store_true',
+                           help='Include sensitive values in export')
     
     def handle(self, **options):
         """Handle the env:export command."""
@@ -378,12 +384,13 @@ class EnvironmentImportCommand(Command):
     name = "env:import"
     description = "Import environment configuration from a file"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('environment', help='Target environment name')
-        self.add_argument('input_file', help='Input file path')
-        self.add_argument('--force', action='store_true',
-                         help='Overwrite existing environment')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('environment', help='Target environment name')
+        parser.add_argument('input_file', help='Input file path')
+        parser.add_argument('--force', action='store_true',
+                           help='Overwrite existing environment')
     
     def handle(self, **options):
         """Handle the env:import command."""
@@ -425,12 +432,13 @@ class EnvironmentCloneCommand(Command):
     name = "env:clone"
     description = "Clone an environment configuration to create a new one"
     
-    def __init__(self):
-        super().__init__()
-        self.add_argument('source', help='Source environment name')
-        self.add_argument('target', help='Target environment name')
-        self.add_argument('--modifications', nargs='*',
-                         help='Modifications in key=value format')
+    @classmethod
+    def configure_parser(cls, parser: argparse.ArgumentParser) -> None:
+        """Register the command's arguments."""
+        parser.add_argument('source', help='Source environment name')
+        parser.add_argument('target', help='Target environment name')
+        parser.add_argument('--modifications', nargs='*',
+                           help='Modifications in key=value format')
     
     def handle(self, **options):
         """Handle the env:clone command."""
@@ -0,0 +1,479 @@
+"""
+Code Generation Commands (larapy make)
+
+Click commands for scaffolding migrations, models, seeders and factories.
+"""
+
+import click
+from functools import lru_cache
+from pathlib import Path
+from ..cli import LarapyGroup
+
+
+@click.group(cls=LarapyGroup, short_help='Generate application components.')
+def make():
+    """Generate application components."""
+    pass
+
+
+# =============================================================================
+# CODE GENERATION COMMANDS (larapy make)
+# =============================================================================
+
+@make.command('migration', short_help='Create a new migration.')
+@click.argument('name')
+@click.option('--create', help='Create a new table')
+@click.option('--table', help='Modify an existing table')
+def make_migration(name: str, create: str, table: str):
+    """Create a new migration."""
+    from datetime import datetime
+    
+    # Create migrations directory if it doesn't exist
+    migrations_dir = Path('database/migrations')
+    migrations_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Generate timestamp prefix (Laravel style: YYYY_MM_DD_HHMMSS)
+    timestamp = datetime.now().strftime('%Y_%m_%d_%H%M%S')
+    
+    # Create migration filename with timestamp prefix
+    migration_filename = f"{timestamp}_{name}.py"
+    
+    # Determine class name
+    class_name = ''.join(word.capitalize() for word in name.replace('_', ' ').split())
+    
+    # Generate migration content
+    if create:
+        content = _generate_create_migration(class_name, create)
+        click.echo(f"Creating migration to create table: {create}")
+    elif table:
+        content = _generate_modify_migration(class_name, table)
+        click.echo(f"Creating migration to modify table: {table}")
+    else:
+        content = _generate_blank_migration(class_name)
+        click.echo("Creating blank migration")
+    
+    # Write migration file
+    migration_file = migrations_dir / migration_filename
+    migration_file.write_text(content)
+    
+    click.echo(f"Migration created: {migration_file}")
+    click.echo(f"Class name: {class_name}")
+
+
+@make.command('model', short_help='Create a new model.')
+@click.argument('name')
+@click.option('--migration', '-m', is_flag=True, help='Create migration as well')
+def make_model(name: str, migration: bool):
+    """Create a new model."""
+    # Create models directory if it doesn't exist
+    models_dir = Path('app/models')
+    models_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Ensure class name is PascalCase
+    class_name = ''.join(word.capitalize() for word in name.replace('_', ' ').replace('-', ' ').split())
+    
+    # Create snake_case file name
+    file_name = _camel_to_snake(class_name)
+    
+    # Generate model content
+    content = _generate_model(class_name)
+    
+    # Write model file
+    model_file = models_dir / f"{file_name}.py"
+    model_file.write_text(content)
+    
+    click.echo(f"Model created: {model_file}")
+    click.echo(f"Class name: {class_name}")
+    
+    if migration:
+        # Create migration as well
+        from datetime import datetime
+        
+        table_name = f"{file_name}s" if not file_name.endswith('s') else file_name
+        
+        # Create migrations directory if it doesn't exist
+        migrations_dir = Path('database/migrations')
+        migrations_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Generate timestamp prefix
+        timestamp = datetime.now().strftime('%Y_%m_%d_%H%M%S')
+        migration_name = f"create_{table_name}_table"
+        migration_filename = f"{timestamp}_{migration_name}.py"
+        migration_class_name = ''.join(word.capitalize() for word in migration_name.split('_'))
+        
+        # Generate migration content
+        migration_content = _generate_create_migration(migration_class_name, table_name)
+        
+        # Write migration file
+        migration_file = migrations_dir / migration_filename
+        migration_file.write_text(migration_content)
+        
+        click.echo(f"Migration created: {migration_file}")
+        click.echo(f"Table name: {table_name}")
+
+
+@make.command('seeder', short_help='Create a new database seeder.')
+@click.argument('name')
+def make_seeder(name: str):
+    """Create a new database seeder."""
+    # Create seeders directory if it doesn't exist
+    seeders_dir = Path('database/seeders')
+    seeders_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Ensure class name ends with Seeder
+    class_name = name if name.endswith('Seeder') else f"{name}Seeder"
+    
+    # Create snake_case file name
+    file_name = _camel_to_snake(class_name)
+    
+    # Generate seeder content
+    content = _generate_seeder(class_name)
+    
+    # Write seeder file
+    seeder_file = seeders_dir / f"{file_name}.py"
+    seeder_file.write_text(content)
+    
+    click.echo(f"Seeder created: {seeder_file}")
+    click.echo(f"Class name: {class_name}")
+
+
+@make.command('factory', short_help='Create a new model factory.')
+@click.argument('name')
+@click.option('--model', help='The name of the model')
+def make_factory(name: str, model: str):
+    """Create a new model factory."""
+    # Create factories directory if it doesn't exist
+    factories_dir = Path('database/factories')
+    factories_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Ensure class name ends with Factory
+    class_name = name if name.endswith('Factory') else f"{name}Factory"
+    
+    # Create snake_case file name
+    file_name = _camel_to_snake(class_name)
+    
+    # Generate factory content
+    model_name = model or name.replace('Factory', '') if name.endswith('Factory') else name
+    content = _generate_factory(class_name, model_name)
+    
+    # Write factory file
+    factory_file = factories_dir / f"{file_name}.py"
+    factory_file.write_text(content)
+    
+    click.echo(f"Factory created: {factory_file}")
+    click.echo(f"Class name: {class_name}")
+    click.echo(f"Model: {model_name}")
+
+
+# =============================================================================
+# HELPER FUNCTIONS FOR CODE GENERATION
+# =============================================================================
+
+def _generate_create_migration(class_name: str, table_name: str) -> str:
+    """Generate create table migration template."""
+    return f'''"""
+Create {table_name} table migration.
+"""
+
+from larapy.database.migrations.migration import Migration
+from larapy.database.migrations.schema import Schema, Blueprint
+
+
+class {class_name}(Migration):
+    """
+    Run the migrations.
+    
+    @return void
+    """
+    
+    def up(self):
+        """
+        Run the migrations.
+        
+        @return void
+        """
+        def create_{table_name}_table(table: Blueprint):
+            table.id()
+            table.timestamps()
+        
+        Schema.create('{table_name}', create_{table_name}_table)
+    
+    def down(self):
+        """
+        Reverse the migrations.
+        
+        @return void
+        """
+        Schema.drop_if_exists('{table_name}')
+'''
+
+
+def _generate_modify_migration(class_name: str, table_name: str) -> str:
+    """Generate modify table migration template."""
+    return f'''"""
+Modify {table_name} table migration.
+"""
+
+from larapy.database.migrations.migration import Migration
+from larapy.database.migrations.schema import Schema, Blueprint
+
+
+class {class_name}(Migration):
+    """
+    Run the migrations.
+    
+    @return void
+    """
+    
+    def up(self):
+        """
+        Run the migrations.
+        
+        @return void
+        """
+        def modify_{table_name}_table(table: Blueprint):
+            # Add your table modifications here
+            # table.string('new_column')
+            pass
+        
+        Schema.table('{table_name}', modify_{table_name}_table)
+    
+    def down(self):
+        """
+        Reverse the migrations.
+        
+        @return void
+        """
+        def rollback_{table_name}_table(table: Blueprint):
+            # Add rollback logic here
+            # table.drop_column('new_column')
+            pass
+        
+        Schema.table('{table_name}', rollback_{table_name}_table)
+'''
+
+
+def _generate_blank_migration(class_name: str) -> str:
+    """Generate blank migration template."""
+    return f'''"""
+{class_name} migration.
+"""
+
+from larapy.database.migrations.migration import Migration
+from larapy.database.migrations.schema import Schema, Blueprint
+
+
+class {class_name}(Migration):
+    """
+    Run the migrations.
+    
+    @return void
+    """
+    
+    def up(self):
+        """
+        Run the migrations.
+        
+        @return void
+        """
+        def create_example_table(table: Blueprint):
+            table.id()
+            table.timestamps()
+        
+        # Schema.create('example_table', create_example_table)
+        pass
+    
+    def down(self):
+        """
+        Reverse the migrations.
+        
+        @return void
+        """
+        # Schema.drop_if_exists('example_table')
+        pass
+'''
+
+
+@lru_cache(maxsize=256)
+def _generate_model(name: str) -> str:
+    """Generate model template that extends the base ORM model."""
+    return f'''"""
+{name} model for database operations.
+"""
+
+from larapy.orm.model import Model
+
+
+class {name}(Model):
+    """
+    {name} model for database interactions.
+    
+    This model represents the {name.lower()} entity in the database.
+    Inherits from the base Larapy ORM Model class.
+    """
+    
+    # Mass assignment protection - specify which fields can be mass assigned
+    fillable = [
+        # Add fillable fields here, e.g.:
+        # 'name',
+        # 'email',
+        # 'description',
+    ]
+    
+    # Specify casts for automatic type conversion
+    casts = {{
+        'created_at': 'datetime',
+        'updated_at': 'datetime',
+    }}
+    
+    # Specify which fields should be hidden when serializing
+    hidden = [
+        # Add hidden fields here, e.g.:
+        # 'password',
+        # 'remember_token',
+    ]
+    
+    # Define relationships
+    def example_relationship(self):
+        """
+        Example relationship method.
+        Uncomment and modify as needed.
+        """
+        # return self.belongs_to('OtherModel')
+        # return self.has_many('RelatedModel')
+        # return self.has_one('RelatedModel')
+        pass
+    
+    # Define scopes for reusable query constraints
+    @classmethod
+    def active(cls):
+        """
+        Scope to get only active records.
+        Example scope method.
+        """
+        # return cls.where('is_active', True)
+        return cls.query()
+    
+    # Define accessors and mutators
+    def get_full_name_attribute(self):
+        """
+        Example accessor for computed attribute.
+        This would create a 'full_name' attribute.
+        """
+        # return f"{{self.first_name}} {{self.last_name}}"
+        pass
+    
+    def set_name_attribute(self, value):
+        """
+        Example mutator for input transformation.
+        This would automatically capitalize the name when set.
+        """
+        return value.title() if value else None
+'''
+
+
+def _generate_seeder(class_name: str) -> str:
+    """Generate seeder template."""
+    return f'''"""
+{class_name} for seeding database tables.
+"""
+
+from larapy.database.migrations.seeder import Seeder
+from app.models.user import User  # Import your models here
+
+
+class {class_name}(Seeder):
+    """
+    {class_name} for populating database tables with test data.
+    """
+    
+    def run(self):
+        """
+        Run the database seeds.
+        
+        @return void
+        """
+        # Example seeder implementation:
+        # 
+        # User.create({{
+        #     'name': 'John Doe',
+        #     'email': 'john@example.com',
+        #     'password': 'hashed_password'
+        # }})
+        # 
+        # for i in range(10):
+        #     User.create({{
+        #         'name': f'User {{i}}',
+        #         'email': f'user{{i}}@example.com',
+        #         'password': 'hashed_password'
+        #     }})
+        
+        pass
+'''
+
+
+def _generate_factory(class_name: str, model_name: str) -> str:
+    """Generate factory template."""
+    return f'''"""
+{class_name} for generating {model_name} test data.
+"""
+
+from larapy.database.migrations.factory import Factory
+from app.models.{model_name.lower()} import {model_name}
+import random
+import string
+
+
+class {class_name}(Factory):
+    """
+    {class_name} for generating {model_name} model instances.
+    """
+    
+    model = {model_name}
+    
+    def definition(self):
+        """
+        Define the model's default state.
+        
+        @return dict
+        """
+        return {{
+            # Example factory definition:
+            # 'name': self.faker.name(),
+            # 'email': self.faker.email(),
+            # 'password': 'password',  # Default password
+            # 'created_at': self.faker.date_time(),
+        }}
+    
+    def configure(self):
+        """
+        Configure the model factory.
+        
+        @return self
+        """
+        return self
+    
+    # Define factory states
+    def unverified(self):
+        """
+        Indicate that the model's email address should be unverified.
+        """
+        return self.state(lambda: {{
+            'email_verified_at': None,
+        }})
+    
+    def admin(self):
+        """
+        Indicate that the user should be an admin.
+        """
+        return self.state(lambda: {{
+            'is_admin': True,
+        }})
+'''
+
+
+def _camel_to_snake(name: str) -> str:
+    """Convert CamelCase to snake_case."""
+    import re
+    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
+    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
@@ -0,0 +1,213 @@
+"""
+Migration Commands (larapy migrate)
+
+Click commands for running, rolling back and inspecting database migrations.
+"""
+
+import atexit
+import click
+from ..cli import LarapyGroup
+
+
+@click.group(cls=LarapyGroup, short_help='Run database migrations.')
+def migrate():
+    """Run database migrations."""
+    pass
+
+
+_migrator = None
+
+
+def _get_migrator():
+    """
+    Get the process-wide migrator.
+    
+    The database configuration is resolved once and the migrator's connection
+    is shared by every command invoked in the same process, then closed at exit.
+    """
+    global _migrator
+    if _migrator is None:
+        from ...database.migrations.migrator import Migrator
+        
+        _migrator = Migrator()
+        atexit.register(_migrator.close)
+    return _migrator
+
+
+# =============================================================================
+# MIGRATION COMMANDS (larapy migrate)
+# =============================================================================
+
+@migrate.command(short_help='Run the database migrations.')
+@click.option('--seed', is_flag=True, help='Indicates if the seed task should be re-run')
+@click.option('--force', is_flag=True, help='Force the operation to run when in production')
+@click.option('--pretend', is_flag=True, help='Dump the SQL queries that would be run')
+@click.option('--step', type=int, help='Number of migrations to run')
+def run(seed: bool, force: bool, pretend: bool, step: int):
+    """Run the database migrations."""
+    try:
+        migrator = _get_migrator()
+        
+        if pretend:
+            count = migrator.migrate(step=step, pretend=True)
+            click.echo(f"📄 {count} migrations would be run.")
+        else:
+            click.echo("🚀 Running migrations...")
+            count = migrator.migrate(step=step, seed=seed)
+            if count > 0:
+                click.echo(f"✅ Migrated {count} migrations successfully.")
+            else:
+                click.echo("✅ Nothing to migrate.")
+        
+    except Exception as e:
+        click.echo(f"❌ Migration failed: {str(e)}")
+
+
+@migrate.command(short_help='Rollback the last database migration batches.')
+@click.option('--step', type=int, default=1, help='Number of migration batches to be reverted')
+@click.option('--force', is_flag=True, help='Force the operation to run when in production')
+@click.option('--pretend', is_flag=True, help='Dump the SQL queries that would be run')
+def rollback(step: int, force: bool, pretend: bool):
+    """Rollback the last database migration batches."""
+    try:
+        migrator = _get_migrator()
+        
+        if pretend:
+            count = migrator.rollback(step=step, pretend=True)
+            click.echo(f"📄 {count} migrations would be rolled back.")
+        else:
+            click.echo(f"🔄 Rolling back {step} migration batch(es)...")
+            count = migrator.rollback(step=step)
+            if count > 0:
+                click.echo(f"✅ Rolled back {count} migrations successfully.")
+            else:
+                click.echo("✅ Nothing to rollback.")
+        
+    except Exception as e:
+        click.echo(f"❌ Rollback failed: {str(e)}")
+
+
+@migrate.command(short_help='Rollback all database migrations.')
+@click.option('--force', is_flag=True, help='Force the operation to run when in production')
+@click.option('--pretend', is_flag=True, help='Dump the SQL queries that would be run')
+def reset(force: bool, pretend: bool):
+    """Rollback all database migrations."""
+    try:
+        migrator = _get_migrator()
+        
+        if pretend:
+            # Get all executed migrations to show what would be reset
+            executed = migrator.get_executed_migrations()
+            click.echo(f"📄 {len(executed)} migrations would be rolled back.")
+        else:
+            click.echo("🔄 Rolling back all migrations...")
+            count = migrator.reset()
+            if count > 0:
+                click.echo(f"✅ Reset {count} migrations successfully.")
+            else:
+                click.echo("✅ No migrations to reset.")
+        
+    except Exception as e:
+        click.echo(f"❌ Reset failed: {str(e)}")
+
+
+@migrate.command(short_help='Reset and re-run all migrations.')
+@click.option('--seed', is_flag=True, help='Indicates if the seed task should be re-run')
+@click.option('--force', is_flag=True, help='Force the operation to run when in production')
+def refresh(seed: bool, force: bool):
+    """Reset and re-run all migrations."""
+    try:
+        migrator = _get_migrator()
+        
+        click.echo("🔄 Refreshing migrations...")
+        reset_count, migrate_count = migrator.refresh(seed=seed)
+        click.echo(f"✅ Reset {reset_count} migrations and migrated {migrate_count} migrations.")
+        
+    except Exception as e:
+        click.echo(f"❌ Refresh failed: {str(e)}")
+
+
+@migrate.command(short_help='Drop all tables and re-run all migrations.')
+@click.option('--seed', is_flag=True, help='Indicates if the seed task should be re-run')
+@click.option('--force', is_flag=True, help='Force the operation to run when in production')
+def fresh(seed: bool, force: bool):
+    """Drop all tables and re-run all migrations."""
+    try:
+        migrator = _get_migrator()
+        
+        click.echo("🗑️  Dropping all tables and running fresh migrations...")
+        count = migrator.fresh(seed=seed)
+        click.echo(f"✅ Fresh migration completed. {count} migrations run.")
+        
+    except Exception as e:
+        click.echo(f"❌ Fresh migration failed: {str(e)}")
+
+
+@migrate.command(short_help='Show the status of each migration.')
+@click.option('--verbose', is_flag=True, help='Show detailed migration information')
+@click.option('--pending', is_flag=True, help='Show only pending migrations')
+@click.option('--executed', is_flag=True, help='Show only executed migrations')
+def status(verbose: bool, pending: bool, executed: bool):
+    """Show the status of each migration."""
+    try:
+        migrator = _get_migrator()
+        status_info = migrator.status(verbose=verbose, pending=pending, executed=executed)
+        
+        click.echo("📊 Migration Status")
+        click.echo("─" * 70)
+        
+        if not status_info['migrations']:
+            click.echo("No migrations found.")
+            return
+        
+        # Table header
+        click.echo(f"{'Migration':<50} {'Batch':<8} {'Status':<10}")
+        click.echo("─" * 70)
+        
+        # Show migrations
+        for migration in status_info['migrations']:
+            status_icon = "✅" if migration['executed'] else "❌"
+            batch_str = str(migration['batch']) if migration['batch'] else "N/A"
+            status_str = "Ran" if migration['executed'] else "Pending"
+            
+            click.echo(f"{migration['filename']:<50} {batch_str:<8} {status_icon} {status_str}")
+        
+        # Summary
+        click.echo("─" * 70)
+        click.echo(f"Total: {status_info['total']} | Executed: {status_info['executed']} | Pending: {status_info['pending']}")
+        
+    except Exception as e:
+        click.echo(f"❌ Status check failed: {str(e)}")
+
+
+@migrate.command(short_help='Create the migration repository.')
+def install():
+    """Create the migration repository."""
+    try:
+        migrator = _get_migrator()
+        
+        click.echo("📦 Installing migration repository...")
+        success = migrator.install()
+        
+        if success:
+            click.echo("✅ Migration repository installed successfully.")
+        else:
+            click.echo("❌ Failed to install migration repository.")
+        
+    except Exception as e:
+        click.echo(f"❌ Installation failed: {str(e)}")
+
+
+# =============================================================================
+# MAIN MIGRATION COMMAND (larapy migrate - shorthand)
+# =============================================================================
+
+@click.command('migrate-main', short_help="Run pending migrations (shorthand for 'migrate run').")
+@click.option('--seed', is_flag=True, help='Indicates if the seed task should be re-run')
+@click.option('--force', is_flag=True, help='Force the operation to run when in production')
+@click.option('--pretend', is_flag=True, help='Dump the SQL queries that would be run')
+def migrate_main(seed: bool, force: bool, pretend: bool):
+    """Run pending migrations (shorthand for 'migrate run')."""
+    # This is equivalent to 'larapy migrate run'
+    ctx = click.get_current_context()
+    ctx.invoke(run, seed=seed, force=force, pretend=pretend, step=None)
@@ -6,19 +6,211 @@ Provides the foundation for all code generators in Larapy.
 
 import os
 import re
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Mapping, Optional, Any, Tuple, Union
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+
+
+# Batches of at least this many files are written on a thread pool when
+# LARAPY_PARALLEL_WRITES=1 is set
+_PARALLEL_WRITE_THRESHOLD = 4
+_MAX_WRITE_WORKERS = 8
+
+# Matches {{variable}} placeholders in generator templates
+_PLACEHOLDER_RE = re.compile(r'\{\{(\w+)\}\}')
+
+
+@lru_cache(maxsize=128)
+def _compile_template(template_content: str) -> tuple:
+    """
+    Split a template into literal segments and placeholder names.
+    
+    Args:
+        template_content: Template content
+        
+    Returns:
+        Tuple alternating literal text (even indices) and variable names (odd indices)
+    """
+    return tuple(_PLACEHOLDER_RE.split(template_content))
+
+
+def _render_segments(segments: tuple, variables: Dict[str, Any]) -> str:
+    """Join compiled template segments, substituting known variables."""
+    parts = list(segments)
+    for i in range(1, len(parts), 2):
+        key = parts[i]
+        parts[i] = str(variables[key]) if key in variables else f"{{{{{key}}}}}"
+    
+    return ''.join(parts)
+
+
+class CompiledTemplate:
+    """A generator template split once into literal text and placeholders."""
+    
+    __slots__ = ('source', 'segments', '_encoded')
+    
+    def __init__(self, source: str):
+        self.source = source
+        self.segments = _compile_template(source)
+        self._encoded = None
+    
+    def render(self, variables: Dict[str, Any]) -> str:
+        """
+        Render the template with variables.
+        
+        Args:
+            variables: Variables to substitute
+            
+        Returns:
+            Rendered template
+        """
+        return _render_segments(self.segments, variables)
+    
+    def render_bytes(self, variables: Dict[str, Any]) -> bytes:
+        """
+        Render the template straight to UTF-8 bytes.
+        
+        The literal text is encoded once and reused, so only the substituted
+        values are encoded per render.
+        
+        Args:
+            variables: Variables to substitute
+            
+        Returns:
+            Rendered template as UTF-8 bytes
+        """
+        if self._encoded is None:
+            self._encoded = tuple(
+                segment.encode('utf-8') if i % 2 == 0 else segment
+                for i, segment in enumerate(self.segments)
+            )
+        
+        parts = list(self._encoded)
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            value = str(variables[key]) if key in variables else f"{{{{{key}}}}}"
+            parts[i] = value.encode('utf-8')
+        
+        return b''.join(parts)
+
+
+# Word separators used by get_class_name
+_NAME_SPLIT_RE = re.compile(r'[-_\s]+')
+
+# PascalCase/camelCase word boundaries used by get_snake_case
+_SNAKE_RE1 = re.compile(r'(.)([A-Z][a-z]+)')
+_SNAKE_RE2 = re.compile(r'([a-z0-9])([A-Z])')
+
+
+@lru_cache(maxsize=1024)
+def _class_name(name: str) -> str:
+    """Cached implementation of BaseGenerator.get_class_name."""
+    # A single word (no underscores, hyphens or whitespace) needs no split
+    if '_' not in name and name.isidentifier():
+        return name.capitalize()
+    
+    # Remove underscores and hyphens, then capitalize each word
+    return ''.join(word.capitalize() for word in _NAME_SPLIT_RE.split(name) if word)
+
+
+@lru_cache(maxsize=1024)
+def _snake_case(name: str) -> str:
+    """Cached implementation of BaseGenerator.get_snake_case."""
+    # Nothing to split when there are no upper-case letters
+    if name.islower():
+        return name
+    
+    # Convert PascalCase/camelCase to snake_case
+    return _SNAKE_RE2.sub(r'\1_\2', _SNAKE_RE1.sub(r'\1_\2', name)).lower()
+
+
+# Plural rules keyed by word ending: (characters to drop, suffix to append).
+# The one- and two-character endings never overlap, so each name matches at
+# most one rule; anything else just gets an 's'.
+_PLURAL_SUFFIX1 = {
+    'y': (1, 'ies'),
+    's': (0, 'es'),
+    'x': (0, 'es'),
+    'z': (0, 'es'),
+    'f': (1, 'ves'),
+}
+_PLURAL_SUFFIX2 = {
+    'sh': (0, 'es'),
+    'ch': (0, 'es'),
+    'fe': (2, 'ves'),
+}
+
+
+@lru_cache(maxsize=1024)
+def _plural(name: str) -> str:
+    """Cached implementation of BaseGenerator.get_plural."""
+    rule = _PLURAL_SUFFIX1.get(name[-1:]) or _PLURAL_SUFFIX2.get(name[-2:])
+    if rule is None:
+        return name + 's'
+    
+    drop, suffix = rule
+    return name[:len(name) - drop] + suffix
+
+
+@lru_cache(maxsize=1024)
+def _format_docstring(description: str, args: Optional[tuple], returns: Optional[str],
+                      indent: str) -> str:
+    """Cached implementation of BaseGenerator.format_docstring (args as a tuple)."""
+    args_block = ''
+    if args:
+        args_block = f'\n{indent}\n{indent}Args:' + ''.join(
+            f'\n{indent}    {arg_name}: {arg_desc}' for arg_name, arg_desc in args
+        )
+    
+    returns_block = f'\n{indent}\n{indent}Returns:\n{indent}    {returns}' if returns else ''
+    
+    return f'{indent}"""\n{indent}{description}{args_block}{returns_block}\n{indent}"""'
+
+
+class _ImportSet:
+    """Ordered collection of import lines with constant-time membership checks."""
+    
+    __slots__ = ('_set', '_list')
+    
+    def __init__(self, imports: Iterable[str] = ()):
+        self._set = set()
+        self._list: List[str] = []
+        for new_import in imports:
+            self.add(new_import)
+    
+    def add(self, new_import: str) -> None:
+        """Add an import unless it is already present."""
+        if new_import not in self._set:
+            self._set.add(new_import)
+            self._list.append(new_import)
+    
+    def __contains__(self, new_import: str) -> bool:
+        return new_import in self._set
+    
+    def __iter__(self):
+        return iter(self._list)
+    
+    def __len__(self) -> int:
+        return len(self._list)
+    
+    def as_list(self) -> List[str]:
+        """Return the imports in insertion order (do not mutate the result)."""
+        return self._list
 
 
 class BaseGenerator(ABC):
     """Base class for all code generators."""
     
     def __init__(self):
-        self.templates: Dict[str, str] = {}
+        self.templates: Mapping[str, str] = {}
         self.variables: Dict[str, Any] = {}
         self.created_files: List[str] = []
+        self._timestamp: Optional[str] = None
+        self._compiled_templates: Dict[str, CompiledTemplate] = {}
+        self._pending_writes: Dict[str, Union[str, bytes]] = {}
+        self._batching = False
         
     @abstractmethod
     def generate(self, name: str, **options) -> bool:
@@ -65,12 +257,32 @@ class BaseGenerator(ABC):
         """
         return self.templates.get(template_name, '')
     
-    def render_template(self, template_content: str, variables: Dict[str, Any] = None) -> str:
+    def get_compiled_template(self, template_name: str) -> CompiledTemplate:
+        """
+        Get a template by name, compiled once and reused across renders.
+        
+        Args:
+            template_name: Name of the template
+            
+        Returns:
+            Compiled template
+        """
+        source = self.get_template(template_name)
+        compiled = self._compiled_templates.get(template_name)
+        
+        # Recompile if the template was replaced since it was compiled
+        if compiled is None or compiled.source is not source:
+            compiled = self._compiled_templates[template_name] = CompiledTemplate(source)
+        
+        return compiled
+    
+    def render_template(self, template_content: Union[str, CompiledTemplate],
+                        variables: Dict[str, Any] = None) -> str:
         """
         Render a template with variables.
         
         Args:
-            template_content: Template content
+            template_content: Template content or a compiled template
             variables: Variables to use for rendering
             
         Returns:
@@ -84,40 +296,222 @@ class BaseGenerator(ABC):
             merged_vars.update(variables)
             variables = merged_vars
         
-        # Simple template rendering (replace {{variable}} with value)
-        rendered = template_content
-        for key, value in variables.items():
-            placeholder = f"{{{{{key}}}}}"
-            rendered = rendered.replace(placeholder, str(value))
+        # Simple template rendering (replace {{variable}} with value) in one pass
+        # over the cached segments; unknown placeholders are left as they are
+        if isinstance(template_content, CompiledTemplate):
+            return template_content.render(variables)
+        
+        return _render_segments(_compile_template(template_content), variables)
+    
+    def render_template_bytes(self, template: CompiledTemplate,
+                              variables: Dict[str, Any] = None) -> bytes:
+        """
+        Render a compiled template to UTF-8 bytes, ready for write_file().
+        
+        Args:
+            template: Compiled template
+            variables: Variables to use for rendering
+            
+        Returns:
+            Rendered template as UTF-8 bytes
+        """
+        if variables is None:
+            variables = self.variables
+        else:
+            # Merge with instance variables
+            merged_vars = self.variables.copy()
+            merged_vars.update(variables)
+            variables = merged_vars
         
-        return rendered
+        return template.render_bytes(variables)
     
-    def write_file(self, file_path: str, content: str, force: bool = False) -> bool:
+    def write_file(self, file_path: str, content: Union[str, bytes], force: bool = False) -> bool:
         """
         Write content to a file.
         
         Args:
             file_path: Path where to write the file
-            content: Content to write
+            content: Content to write (str, or UTF-8 bytes)
             force: Whether to overwrite existing files
             
         Returns:
-            True if file was written successfully
+            True if file was written successfully (or queued, when batching)
         """
-        path = Path(file_path)
+        path = os.fspath(file_path)
+        
+        if self._batching:
+            return self._queue_write(path, content, force)
         
         # Check if file exists and force is not enabled
-        if path.exists() and not force:
+        if not force and os.path.exists(path):
             return False
         
         # Create directory if it doesn't exist
-        path.parent.mkdir(parents=True, exist_ok=True)
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
         
+        return self._write_contents(path, content)
+    
+    def write_files(self, items: List[Tuple[str, Union[str, bytes]]], force: bool = False) -> bool:
+        """
+        Write several files, creating each parent directory only once.
+        
+        Args:
+            items: List of (file_path, content) tuples
+            force: Whether to overwrite existing files
+            
+        Returns:
+            True if every file was written successfully
+        """
+        paths = [(os.fspath(file_path), content) for file_path, content in items]
+        
+        # Create the distinct parent directories, shallowest first
+        directories = {os.path.dirname(path) for path, _ in paths}
+        directories.discard('')
+        for directory in sorted(directories, key=lambda d: d.count(os.sep)):
+            os.makedirs(directory, exist_ok=True)
+        
+        written = True
+        if not force:
+            # A path listed twice is skipped the second time, as it exists by then
+            seen = set()
+            pending = []
+            for path, content in paths:
+                if path in seen or os.path.exists(path):
+                    written = False
+                    continue
+                seen.add(path)
+                pending.append((path, content))
+            paths = pending
+        
+        if (len(paths) >= _PARALLEL_WRITE_THRESHOLD
+                and os.environ.get('LARAPY_PARALLEL_WRITES') == '1'):
+            # Each path is written by one worker only, with its last content
+            paths = list(dict(paths).items())
+            
+            # Workers only write; created files are recorded here, in order
+            workers = min(_MAX_WRITE_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(lambda item: self._write_contents(*item, record=False),
+                                            paths))
+            
+            for (path, _), result in zip(paths, results):
+                if result:
+                    self.created_files.append(path)
+                written = result and written
+            
+            return written
+        
+        for path, content in paths:
+            written = self._write_contents(path, content) and written
+        
+        return written
+    
+    def enable_batching(self) -> None:
+        """
+        Queue write_file() calls until flush_batch() is called.
+        
+        Lets a scaffold run render every file first and then write them
+        back-to-back, creating each directory once.
+        """
+        self._batching = True
+    
+    def flush_batch(self) -> bool:
+        """
+        Write every batched file and stop batching.
+        
+        Returns:
+            True if every batched file was written successfully
+        """
+        self._batching = False
+        return self._flush_pending()
+    
+    def _queue_write(self, file_path: str, content: Union[str, bytes], force: bool = False) -> bool:
+        """
+        Queue a file to be written by the next _flush_pending() call.
+        
+        The existence check happens here, so the return value matches what
+        write_file() would report for a file that is skipped.
+        
+        Args:
+            file_path: Path where to write the file
+            content: Content to write
+            force: Whether to overwrite existing files
+            
+        Returns:
+            True if the file was queued
+        """
+        path = os.fspath(file_path)
+        
+        if self._write_skipped(path, force):
+            return False
+        
+        self._pending_writes[path] = content
+        return True
+    
+    def _write_skipped(self, file_path: str, force: bool = False) -> bool:
+        """
+        Check whether a write to a path would be refused.
+        
+        Generators call this before rendering so files that will not be
+        written are never rendered.
+        
+        Args:
+            file_path: Path of the file
+            force: Whether existing files are overwritten
+            
+        Returns:
+            True if the file exists or is already queued and force is off
+        """
+        if force:
+            return False
+        
+        path = os.fspath(file_path)
+        return path in self._pending_writes or os.path.exists(path)
+    
+    def _flush_pending(self) -> bool:
+        """
+        Write every queued file in one batch.
+        
+        Returns:
+            True if every queued file was written successfully
+        """
+        if not self._pending_writes:
+            return True
+        
+        items = list(self._pending_writes.items())
+        self._pending_writes.clear()
+        return self.write_files(items, force=True)
+    
+    def _write_contents(self, path: str, content: Union[str, bytes], record: bool = True) -> bool:
+        """
+        Write content to a path whose directory already exists.
+        
+        The content (encoded, unless it is already bytes) is handed to
+        os.write() directly, which takes a single call unless the kernel
+        accepts a partial write.
+        
+        Args:
+            path: Path of the file to write
+            content: Content to write
+            record: Whether to add the path to the created files
+            
+        Returns:
+            True if file was written successfully
+        """
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            data = content if isinstance(content, bytes) else content.encode('utf-8')
+            view = memoryview(data)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
             
-            self.created_files.append(str(path))
+            if record:
+                self.created_files.append(path)
             return True
             
         except Exception:
@@ -133,7 +527,7 @@ class BaseGenerator(ABC):
         Returns:
             True if file exists
         """
-        return Path(file_path).exists()
+        return os.path.exists(file_path)
     
     def ensure_directory(self, directory: str) -> None:
         """
@@ -142,7 +536,7 @@ class BaseGenerator(ABC):
         Args:
             directory: Directory path
         """
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        os.makedirs(directory, exist_ok=True)
     
     def get_class_name(self, name: str) -> str:
         """
@@ -154,9 +548,7 @@ class BaseGenerator(ABC):
         Returns:
             Class name in PascalCase
         """
-        # Remove underscores and hyphens, then capitalize each word
-        words = re.split(r'[-_\s]+', name)
-        return ''.join(word.capitalize() for word in words if word)
+        return _class_name(name)
     
     def get_snake_case(self, name: str) -> str:
         """
@@ -168,9 +560,7 @@ class BaseGenerator(ABC):
         Returns:
             Name in snake_case
         """
-        # Convert PascalCase/camelCase to snake_case
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        return _snake_case(name)
     
     def get_kebab_case(self, name: str) -> str:
         """
@@ -194,16 +584,7 @@ class BaseGenerator(ABC):
         Returns:
             Plural form
         """
-        if name.endswith('y'):
-            return name[:-1] + 'ies'
-        elif name.endswith(('s', 'sh', 'ch', 'x', 'z')):
-            return name + 'es'
-        elif name.endswith('f'):
-            return name[:-1] + 'ves'
-        elif name.endswith('fe'):
-            return name[:-2] + 'ves'
-        else:
-            return name + 's'
+        return _plural(name)
     
     def get_table_name(self, model_name: str) -> str:
         """
@@ -222,10 +603,20 @@ class BaseGenerator(ABC):
         """
         Get current timestamp for migrations.
         
+        The timestamp is taken once and reused for the rest of the run so
+        that migrations generated together share it; call
+        invalidate_timestamp() to take a fresh one.
+        
         Returns:
             Timestamp string in format YYYY_MM_DD_HHMMSS
         """
-        return datetime.now().strftime('%Y_%m_%d_%H%M%S')
+        if self._timestamp is None:
+            self._timestamp = datetime.now().strftime('%Y_%m_%d_%H%M%S')
+        return self._timestamp
+    
+    def invalidate_timestamp(self) -> None:
+        """Discard the cached migration timestamp."""
+        self._timestamp = None
     
     def get_migration_name(self, description: str) -> str:
         """
@@ -241,50 +632,48 @@ class BaseGenerator(ABC):
         snake_description = self.get_snake_case(description)
         return f"{timestamp}_{snake_description}.py"
     
-    def add_import(self, imports: List[str], new_import: str) -> List[str]:
+    def add_import(self, imports: Union[List[str], _ImportSet], new_import: str) -> List[str]:
         """
         Add an import to the imports list if it doesn't exist.
         
+        Passing an _ImportSet instead of a list makes the duplicate check
+        constant-time when many imports are added.
+        
         Args:
-            imports: Current imports list
+            imports: Current imports list or _ImportSet
             new_import: New import to add
             
         Returns:
             Updated imports list
         """
+        if isinstance(imports, _ImportSet):
+            imports.add(new_import)
+            return imports.as_list()
+        
         if new_import not in imports:
             imports.append(new_import)
         return imports
     
-    def format_docstring(self, description: str, args: List[tuple] = None, 
+    def format_docstring(self, description: str, args: Union[List[tuple], Tuple[tuple, ...]] = None,
                         returns: str = None, indent: str = "    ") -> str:
         """
         Format a docstring with proper indentation.
         
         Args:
             description: Method description
-            args: List of (name, description) tuples for arguments
+            args: List or tuple of (name, description) tuples for arguments
             returns: Return value description
             indent: Indentation string
             
         Returns:
             Formatted docstring
         """
-        lines = [f'{indent}"""', f'{indent}{description}']
-        
-        if args:
-            lines.append(f'{indent}')
-            lines.append(f'{indent}Args:')
-            for arg_name, arg_desc in args:
-                lines.append(f'{indent}    {arg_name}: {arg_desc}')
-        
-        if returns:
-            lines.append(f'{indent}')
-            lines.append(f'{indent}Returns:')
-            lines.append(f'{indent}    {returns}')
-        
-        lines.append(f'{indent}"""')
-        return '\n'.join(lines)
+        # The result is cached, so the arguments must be hashable
+        if not args:
+            args = None
+        elif not isinstance(args, tuple):
+            args = tuple(tuple(arg) for arg in args)
+        return _format_docstring(description, args, returns, indent)
     
     def get_created_files(self) -> List[str]:
         """
@@ -298,4 +687,7 @@ class BaseGenerator(ABC):
     def reset(self) -> None:
         """Reset the generator state."""
         self.variables.clear()
-        self.created_files.clear()
\ No newline at end of file
+        self.created_files.clear()
+        self._timestamp = None
+        self._pending_writes.clear()
+        self._batching = False
\ No newline at end of file
@@ -4,14 +4,60 @@ Component Generator
 Generates view components for Larapy applications.
 """
 
+import io
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from .base_generator import BaseGenerator
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+from functools import lru_cache
+from .base_generator import BaseGenerator, CompiledTemplate
+
+
+# Component types, interned so dispatch lookups compare by identity
+_TYPE_BASIC = sys.intern('basic')
+_TYPE_FORM = sys.intern('form')
+_TYPE_DATA = sys.intern('data')
+_TYPE_LAYOUT = sys.intern('layout')
+
+# Fragments of a generated form field definition
+_FIELD_NAME = "{'name': '"
+_FIELD_TYPE = "', 'type': '"
+_FIELD_LABEL = "', 'label': '"
+_FIELD_REQUIRED = "', 'required': "
+
+
+@lru_cache(maxsize=256)
+def _field_label(name: str) -> str:
+    """Derive a form field label from its name."""
+    return name.replace('_', ' ').title()
 
 
 class ComponentGenerator(BaseGenerator):
     """Generates view component classes."""
     
+    # Component type to class generator method
+    _CLASS_DISPATCH = {
+        _TYPE_BASIC: '_generate_basic_component',
+        _TYPE_FORM: '_generate_form_component',
+        _TYPE_DATA: '_generate_data_component',
+        _TYPE_LAYOUT: '_generate_layout_component'
+    }
+    
+    # Component type to view template name
+    _TEMPLATE_NAME = {
+        _TYPE_BASIC: 'basic_template',
+        _TYPE_FORM: 'form_template',
+        _TYPE_DATA: 'data_template',
+        _TYPE_LAYOUT: 'layout_template'
+    }
+    
+    # Component type to view template content method
+    _TEMPLATE_CONTENT = {
+        _TYPE_BASIC: '_get_basic_template_content',
+        _TYPE_FORM: '_get_form_template_content',
+        _TYPE_DATA: '_get_data_template_content',
+        _TYPE_LAYOUT: '_get_layout_template_content'
+    }
+    
     def __init__(self):
         super().__init__()
         self._load_templates()
@@ -22,60 +68,99 @@ class ComponentGenerator(BaseGenerator):
         
         Args:
             name: Component name
-            **options: Generation options
+            **options: Generation options; pass _defer_flush=True to leave
+                the files queued for a later _flush_pending() call
             
         Returns:
             True if generation was successful
         """
+        defer_flush = options.pop('_defer_flush', False)
+        component_type = options.get('type', _TYPE_BASIC)
+        if isinstance(component_type, str):
+            options['type'] = sys.intern(component_type)
         class_name = self.get_class_name(name)
+        snake_name = self.get_snake_case(class_name)
+        kebab_name = self.get_kebab_case(class_name)
         
         # Generate component class
-        success = self._generate_component_class(class_name, **options)
+        success = self._generate_component_class(class_name, snake_name, kebab_name, options)
         
         # Generate component template if requested
         if success and options.get('template', True):
-            success &= self._generate_component_template(class_name, **options)
+            success &= self._generate_component_template(class_name, kebab_name, options)
+        
+        # Write the class and template files together
+        if not defer_flush:
+            success = self._flush_pending() and success
         
         return success
     
-    def _generate_component_class(self, class_name: str, **options) -> bool:
+    def generate_many(self, specs: Iterable[Tuple[str, Dict[str, Any]]]) -> bool:
+        """
+        Generate several components and write their files in one batch.
+        
+        Args:
+            specs: Iterable of (name, options) tuples
+            
+        Returns:
+            True if every component was generated successfully
+        """
+        success = True
+        for name, options in specs:
+            success = self.generate(name, **{**options, '_defer_flush': True}) and success
+        
+        return self._flush_pending() and success
+    
+    def _generate_component_class(self, class_name: str, snake_name: str, kebab_name: str,
+                                  options: Dict[str, Any]) -> bool:
         """Generate the component class."""
-        component_type = options.get('type', 'basic')
-        
-        if component_type == 'form':
-            return self._generate_form_component(class_name, **options)
-        elif component_type == 'data':
-            return self._generate_data_component(class_name, **options)
-        elif component_type == 'layout':
-            return self._generate_layout_component(class_name, **options)
-        else:
-            return self._generate_basic_component(class_name, **options)
+        component_type = options.get('type', _TYPE_BASIC)
+        method = self._CLASS_DISPATCH.get(component_type, '_generate_basic_component')
+        
+        return getattr(self, method)(class_name, snake_name, kebab_name, options)
     
-    def _generate_basic_component(self, class_name: str, **options) -> bool:
+    def _generate_basic_component(self, class_name: str, snake_name: str, kebab_name: str,
+                                  options: Dict[str, Any]) -> bool:
         """Generate a basic component."""
+        file_path = f"app/view/components/{snake_name}.py"
+        force = options.get('force', False)
+        if self._write_skipped(file_path, force):
+            return False
+        
+        init_params, property_docs, property_assignments = self._generate_properties(
+            options.get('props', [])
+        )
+        
         # Set template variables
         variables = {
             'class_name': class_name,
-            'component_name': self.get_kebab_case(class_name),
-            'properties': self._generate_properties(options.get('props', [])),
+            'component_name': kebab_name,
+            'init_params': init_params,
+            'property_docs': property_docs,
+            'property_assignments': property_assignments,
             'data_method': self._generate_data_method(options.get('data', {})),
             'methods': self._generate_component_methods(options.get('methods', []))
         }
         
         # Render template
-        template_content = self.get_template('basic_component')
-        content = self.render_template(template_content, variables)
+        template = self.get_compiled_template('basic_component')
+        content = self.render_template(template, variables)
         
         # Write file
-        file_path = f"app/view/components/{self.get_snake_case(class_name)}.py"
-        return self.write_file(file_path, content, options.get('force', False))
+        return self._queue_write(file_path, content, force)
     
-    def _generate_form_component(self, class_name: str, **options) -> bool:
+    def _generate_form_component(self, class_name: str, snake_name: str, kebab_name: str,
+                                 options: Dict[str, Any]) -> bool:
         """Generate a form component."""
+        file_path = f"app/view/components/{snake_name}.py"
+        force = options.get('force', False)
+        if self._write_skipped(file_path, force):
+            return False
+        
         # Set template variables
         variables = {
             'class_name': class_name,
-            'component_name': self.get_kebab_case(class_name),
+            'component_name': kebab_name,
             'form_method': options.get('method', 'POST'),
             'form_action': options.get('action', ''),
             'fields': self._generate_form_fields(options.get('fields', [])),
@@ -83,19 +168,24 @@ class ComponentGenerator(BaseGenerator):
         }
         
         # Render template
-        template_content = self.get_template('form_component')
-        content = self.render_template(template_content, variables)
+        template = self.get_compiled_template('form_component')
+        content = self.render_template(template, variables)
         
         # Write file
-        file_path = f"app/view/components/{self.get_snake_case(class_name)}.py"
-        return self.write_file(file_path, content, options.get('force', False))
+        return self._queue_write(file_path, content, force)
     
-    def _generate_data_component(self, class_name: str, **options) -> bool:
+    def _generate_data_component(self, class_name: str, snake_name: str, kebab_name: str,
+                                 options: Dict[str, Any]) -> bool:
         """Generate a data component."""
+        file_path = f"app/view/components/{snake_name}.py"
+        force = options.get('force', False)
+        if self._write_skipped(file_path, force):
+            return False
+        
         # Set template variables
         variables = {
             'class_name': class_name,
-            'component_name': self.get_kebab_case(class_name),
+            'component_name': kebab_name,
             'data_source': options.get('data_source', 'database'),
             'model': options.get('model', ''),
             'query_method': self._generate_query_method(options),
@@ -104,71 +194,98 @@ class ComponentGenerator(BaseGenerator):
         }
         
         # Render template
-        template_content = self.get_template('data_component')
-        content = self.render_template(template_content, variables)
+        template = self.get_compiled_template('data_component')
+        content = self.render_template(template, variables)
         
         # Write file
-        file_path = f"app/view/components/{self.get_snake_case(class_name)}.py"
-        return self.write_file(file_path, content, options.get('force', False))
+        return self._queue_write(file_path, content, force)
     
-    def _generate_layout_component(self, class_name: str, **options) -> bool:
+    def _generate_layout_component(self, class_name: str, snake_name: str, kebab_name: str,
+                                   options: Dict[str, Any]) -> bool:
         """Generate a layout component."""
+        file_path = f"app/view/components/{snake_name}.py"
+        force = options.get('force', False)
+        if self._write_skipped(file_path, force):
+            return False
+        
         # Set template variables
         variables = {
             'class_name': class_name,
-            'component_name': self.get_kebab_case(class_name),
+            'component_name': kebab_name,
             'slots': self._generate_slots(options.get('slots', ['default'])),
             'layout_data': self._generate_layout_data(options)
         }
         
         # Render template
-        template_content = self.get_template('layout_component')
-        content = self.render_template(template_content, variables)
+        template = self.get_compiled_template('layout_component')
+        content = self.render_template(template, variables)
         
         # Write file
-        file_path = f"app/view/components/{self.get_snake_case(class_name)}.py"
-        return self.write_file(file_path, content, options.get('force', False))
+        return self._queue_write(file_path, content, force)
     
-    def _generate_component_template(self, class_name: str, **options) -> bool:
+    def _generate_component_template(self, class_name: str, kebab_name: str,
+                                     options: Dict[str, Any]) -> bool:
         """Generate the component template."""
-        component_type = options.get('type', 'basic')
-        
-        # Set template variables
-        variables = {
-            'class_name': class_name,
-            'component_name': self.get_kebab_case(class_name),
-            'template_content': self._get_template_content(component_type, **options)
-        }
-        
-        # Render template
-        if component_type == 'form':
-            template_content = self.get_template('form_template')
-        elif component_type == 'data':
-            template_content = self.get_template('data_template')
-        elif component_type == 'layout':
-            template_content = self.get_template('layout_template')
+        component_dir = "resources/views/components"
+        file_path = f"{component_dir}/{kebab_name}.html"
+        force = options.get('force', False)
+        if self._write_skipped(file_path, force):
+            return False
+        
+        component_type = options.get('type', _TYPE_BASIC)
+        template_name = self._TEMPLATE_NAME.get(component_type, 'basic_template')
+        template_content = self._get_template_content(component_type, options)
+        
+        if self.templates.get(template_name) is _TEMPLATES[template_name]:
+            # The stock view templates only put a heading above the content
+            heading = _VIEW_HEADINGS[template_name]
+            content = f"<!-- {class_name} {heading} Template -->\n{template_content}"
         else:
-            template_content = self.get_template('basic_template')
-        
-        content = self.render_template(template_content, variables)
+            # Set template variables
+            variables = {
+                'class_name': class_name,
+                'component_name': kebab_name,
+                'template_content': template_content
+            }
+            
+            # Render template
+            template = self.get_compiled_template(template_name)
+            content = self.render_template(template, variables)
         
         # Write file
-        component_dir = f"resources/views/components"
-        file_path = f"{component_dir}/{self.get_kebab_case(class_name)}.html"
-        return self.write_file(file_path, content, options.get('force', False))
+        return self._queue_write(file_path, content, force)
     
-    def _generate_properties(self, props: List[Dict[str, Any]]) -> str:
-        """Generate component properties."""
-        if not props:
-            return ""
+    def _generate_properties(self, props: List[Dict[str, Any]]) -> Tuple[str, str, str]:
+        """
+        Generate the __init__ parameters, docstring args and assignments.
         
-        prop_lines = []
+        Args:
+            props: Property definitions
+            
+        Returns:
+            Tuple of (parameters, docstring args, assignments) blocks
+        """
+        required_lines = []
+        optional_lines = []
+        assignments = []
         for prop in props:
             prop_line = self._generate_property(prop)
             if prop_line:
-                prop_lines.append(prop_line)
-        
-        return '\n    '.join(prop_lines)
+                name = prop['name']
+                # Parameters without a default must precede defaulted ones
+                if prop.get('default') is None and prop.get('required', False):
+                    required_lines.append(prop_line)
+                else:
+                    optional_lines.append(prop_line)
+                assignments.append(f"\n        self.{name} = {name}")
+        
+        prop_lines = required_lines + optional_lines
+        params = ''.join(f", {line}" for line in prop_lines)
+        docs = ''.join(f"\n            {line}" for line in prop_lines)
+        if docs:
+            docs = f"\n        \n        Args:{docs}"
+        
+        return params, docs, ''.join(assignments)
     
     def _generate_property(self, prop: Dict[str, Any]) -> str:
         """Generate a single property."""
@@ -199,14 +316,17 @@ class ComponentGenerator(BaseGenerator):
         if not data:
             return "return {}"
         
-        data_items = []
+        buffer = io.StringIO()
+        buffer.write("return {")
+        separator = "\n            "
         for key, value in data.items():
-            if isinstance(value, str):
-                data_items.append(f"'{key}': '{value}'")
-            else:
-                data_items.append(f"'{key}': {value}")
+            buffer.write(separator)
+            buffer.write(f"'{key}': ")
+            buffer.write(repr(value) if isinstance(value, str) else str(value))
+            separator = ",\n            "
+        buffer.write("\n        }")
         
-        return f"return {{\n            {',\n            '.join(data_items)}\n        }}"
+        return buffer.getvalue()
     
     def _generate_component_methods(self, methods: List[Dict[str, str]]) -> str:
         """Generate component methods."""
@@ -243,25 +363,40 @@ class ComponentGenerator(BaseGenerator):
         if not fields:
             return "[]"
         
-        field_definitions = []
+        buffer = io.StringIO()
+        buffer.write("[")
+        separator = ""
         for field in fields:
             field_def = self._generate_form_field(field)
             if field_def:
-                field_definitions.append(field_def)
-        
-        return f"[{', '.join(field_definitions)}]"
-    
-    def _generate_form_field(self, field: Dict[str, str]) -> str:
-        """Generate a single form field definition."""
+                name, field_type, label, required = field_def
+                buffer.write(separator)
+                buffer.write(_FIELD_NAME)
+                buffer.write(name)
+                buffer.write(_FIELD_TYPE)
+                buffer.write(field_type)
+                buffer.write(_FIELD_LABEL)
+                buffer.write(label)
+                buffer.write(_FIELD_REQUIRED)
+                buffer.write(required)
+                buffer.write("}")
+                separator = ", "
+        buffer.write("]")
+        
+        return buffer.getvalue()
+    
+    def _generate_form_field(self, field: Dict[str, str]) -> Optional[Tuple[str, str, str, str]]:
+        """Get the (name, type, label, required) values of a form field definition."""
         name = field.get('name')
-        field_type = field.get('type', 'text')
-        label = field.get('label', name.replace('_', ' ').title() if name else '')
-        required = field.get('required', False)
         
         if not name:
-            return ""
+            return None
+        
+        field_type = field.get('type', 'text')
+        label = field.get('label') if 'label' in field else _field_label(name)
+        required = 'true' if field.get('required', False) else 'false'
         
-        return f"{{'name': '{name}', 'type': '{field_type}', 'label': '{label}', 'required': {str(required).lower()}}}"
+        return name, field_type, label, required
     
     def _generate_validation_rules(self, validation: Dict[str, str]) -> str:
         """Generate validation rules."""
@@ -280,11 +415,10 @@ class ComponentGenerator(BaseGenerator):
         filters = options.get('filters', {})
         order_by = options.get('order_by')
         
-        query_parts = [f"{model}.query()"]
+        query_parts = [model, ".query()"]
         
         # Add filters
-        for field, value in filters.items():
-            query_parts.append(f".where('{field}', '{value}')")
+        query_parts.extend(f".where('{field}', {value!r})" for field, value in filters.items())
         
         # Add ordering
         if order_by:
@@ -308,32 +442,20 @@ class ComponentGenerator(BaseGenerator):
     
     def _generate_layout_data(self, options: Dict[str, Any]) -> str:
         """Generate layout-specific data."""
-        layout_data = options.get('layout_data', {})
-        
-        if not layout_data:
-            return "return {}"
-        
-        data_items = []
-        for key, value in layout_data.items():
-            if isinstance(value, str):
-                data_items.append(f"'{key}': '{value}'")
-            else:
-                data_items.append(f"'{key}': {value}")
-        
-        return f"return {{\n            {',\n            '.join(data_items)}\n        }}"
+        # Same shape as the basic component's data() body
+        return self._generate_data_method(options.get('layout_data', {}))
     
-    def _get_template_content(self, component_type: str, **options) -> str:
+    def _get_template_content(self, component_type: str, options: Dict[str, Any]) -> str:
         """Get template content based on component type."""
-        if component_type == 'form':
-            return self._get_form_template_content(**options)
-        elif component_type == 'data':
-            return self._get_data_template_content(**options)
-        elif component_type == 'layout':
-            return self._get_layout_template_content(**options)
-        else:
-            return '<div class="component">\n    <!-- Component content goes here -->\n    <p>{{component_name}} component</p>\n</div>'
+        method = self._TEMPLATE_CONTENT.get(component_type, '_get_basic_template_content')
+        
+        return getattr(self, method)(options)
+    
+    def _get_basic_template_content(self, options: Dict[str, Any]) -> str:
+        """Get basic template content."""
+        return '<div class="component">\n    <!-- Component content goes here -->\n    <p>{{component_name}} component</p>\n</div>'
     
-    def _get_form_template_content(self, **options) -> str:
+    def _get_form_template_content(self, options: Dict[str, Any]) -> str:
         """Get form template content."""
         return '''<form method="{{form_method}}" action="{{form_action}}" class="component-form">
     {% for field in fields %}
@@ -350,7 +472,7 @@ class ComponentGenerator(BaseGenerator):
     <button type="submit" class="btn btn-primary">Submit</button>
 </form>'''
     
-    def _get_data_template_content(self, **options) -> str:
+    def _get_data_template_content(self, options: Dict[str, Any]) -> str:
         """Get data template content."""
         return '''<div class="data-component">
     {% if items %}
@@ -373,7 +495,7 @@ class ComponentGenerator(BaseGenerator):
     {% endif %}
 </div>'''
     
-    def _get_layout_template_content(self, **options) -> str:
+    def _get_layout_template_content(self, options: Dict[str, Any]) -> str:
         """Get layout template content."""
         return '''<div class="layout-component">
     <header class="component-header">
@@ -397,7 +519,12 @@ class ComponentGenerator(BaseGenerator):
     
     def _load_templates(self):
         """Load component templates."""
-        self.templates['basic_component'] = '''"""
+        self.templates.update(_TEMPLATES)
+        self._compiled_templates.update(_COMPILED_TEMPLATES)
+
+
+# Component class templates
+_BASIC_COMPONENT_TEMPLATE = '''"""
 {{class_name}} View Component
 
 Basic view component for {{component_name}}.
@@ -410,12 +537,10 @@ from typing import Dict, Any
 class {{class_name}}(Component):
     """{{class_name}} view component."""
     
-    def __init__(self{{properties and ', ' + properties or ''}}):
+    def __init__(self{{init_params}}):
         """
-        Initialize the component.
-        
-        Args:{{properties and '\n            ' + properties.replace('\n    ', '\n            ') or ''}}
-        """{{properties and '\n        ' + '\n        '.join(f'self.{prop.split(":")[0].strip()} = {prop.split(":")[0].strip()}' for prop in properties.split('\n') if prop.strip()) or ''}}
+        Initialize the component.{{property_docs}}
+        """{{property_assignments}}
         super().__init__()
     
     def render(self):
@@ -427,7 +552,7 @@ class {{class_name}}(Component):
         {{data_method}}{{methods}}
 '''
 
-        self.templates['form_component'] = '''"""
+_FORM_COMPONENT_TEMPLATE = '''"""
 {{class_name}} Form Component
 
 Form component for {{component_name}}.
@@ -508,7 +633,7 @@ class {{class_name}}(Component):
         return errors
 '''
 
-        self.templates['data_component'] = '''"""
+_DATA_COMPONENT_TEMPLATE = '''"""
 {{class_name}} Data Component
 
 Data component for {{component_name}}.
@@ -550,7 +675,7 @@ class {{class_name}}(Component):
         return []
 '''
 
-        self.templates['layout_component'] = '''"""
+_LAYOUT_COMPONENT_TEMPLATE = '''"""
 {{class_name}} Layout Component
 
 Layout component for {{component_name}}.
@@ -583,15 +708,37 @@ class {{class_name}}(Component):
         {{layout_data}}
 '''
 
-        # Template files
-        self.templates['basic_template'] = '''<!-- {{class_name}} Component Template -->
+# Component view templates
+_BASIC_VIEW_TEMPLATE = '''<!-- {{class_name}} Component Template -->
 {{template_content}}'''
 
-        self.templates['form_template'] = '''<!-- {{class_name}} Form Component Template -->
+_FORM_VIEW_TEMPLATE = '''<!-- {{class_name}} Form Component Template -->
 {{template_content}}'''
 
-        self.templates['data_template'] = '''<!-- {{class_name}} Data Component Template -->
+_DATA_VIEW_TEMPLATE = '''<!-- {{class_name}} Data Component Template -->
 {{template_content}}'''
 
-        self.templates['layout_template'] = '''<!-- {{class_name}} Layout Component Template -->
-{{template_content}}'''
\ No newline at end of file
+_LAYOUT_VIEW_TEMPLATE = '''<!-- {{class_name}} Layout Component Template -->
+{{template_content}}'''
+
+# Headings of the stock view templates, rendered without the template engine
+_VIEW_HEADINGS = {
+    'basic_template': 'Component',
+    'form_template': 'Form Component',
+    'data_template': 'Data Component',
+    'layout_template': 'Layout Component',
+}
+
+_TEMPLATES = {
+    'basic_component': _BASIC_COMPONENT_TEMPLATE,
+    'form_component': _FORM_COMPONENT_TEMPLATE,
+    'data_component': _DATA_COMPONENT_TEMPLATE,
+    'layout_component': _LAYOUT_COMPONENT_TEMPLATE,
+    'basic_template': _BASIC_VIEW_TEMPLATE,
+    'form_template': _FORM_VIEW_TEMPLATE,
+    'data_template': _DATA_VIEW_TEMPLATE,
+    'layout_template': _LAYOUT_VIEW_TEMPLATE,
+}
+
+# Compiled once per process and shared by every ComponentGenerator
+_COMPILED_TEMPLATES = {name: CompiledTemplate(source) for name, source in _TEMPLATES.items()}
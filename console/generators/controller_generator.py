@@ -4,9 +4,20 @@ Controller Generator
 Generates controller classes for Larapy applications.
 """
 
+import io
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
-from .base_generator import BaseGenerator
+from functools import lru_cache
+from .base_generator import BaseGenerator, CompiledTemplate
+from .templating import compile_template
+
+
+# Custom controller method, filled in with str.format_map
+_CUSTOM_METHOD_TEMPLATE = """
+{docstring}
+    def {name}({parameters}) -> {return_type}:
+        {body}"""
 
 
 class ControllerGenerator(BaseGenerator):
@@ -42,17 +53,20 @@ class ControllerGenerator(BaseGenerator):
     
     def _generate_basic_controller(self, class_name: str, **options) -> bool:
         """Generate a basic controller."""
+        model = options.get('model', '')
+        
         # Set template variables
         variables = {
             'class_name': class_name,
             'description': options.get('description', f"{class_name} for handling HTTP requests"),
-            'model': options.get('model', ''),
+            'model': model,
+            'model_import': self._model_import_line(model),
             'methods': self._generate_custom_methods(options.get('methods', []))
         }
         
         # Render template
-        template_content = self.get_template('basic_controller')
-        content = self.render_template(template_content, variables)
+        template = self.get_compiled_template('basic_controller')
+        content = self.render_template_bytes(template, variables)
         
         # Write file
         file_path = f"app/http/controllers/{self.get_snake_case(class_name)}.py"
@@ -62,37 +76,181 @@ class ControllerGenerator(BaseGenerator):
         """Generate a resource controller."""
         model = options.get('model', '')
         model_class = self.get_class_name(model) if model else ''
+        model_variable = self.get_snake_case(model_class) if model_class else 'item'
+        model_plural = self.get_plural(model_variable)
         
         # Set template variables
         variables = {
             'class_name': class_name,
             'model_class': model_class,
-            'model_import': f"from app.models.{self.get_snake_case(model_class)} import {model_class}" if model_class else "",
-            'model_variable': self.get_snake_case(model_class) if model_class else 'item',
-            'model_plural': self.get_plural(self.get_snake_case(model_class)) if model_class else 'items',
+            'model_import': self._model_import_line(model_class),
+            'model_variable': model_variable,
+            'model_plural': model_plural,
             'is_api': api,
-            'resource_methods': self._generate_resource_methods(model_class, api, **options)
+            'resource_methods': self._generate_resource_methods(model_class, model_variable,
+                                                                model_plural, api, **options)
         }
         
         # Choose template
         template_name = 'api_resource_controller' if api else 'web_resource_controller'
-        template_content = self.get_template(template_name)
-        content = self.render_template(template_content, variables)
+        template = self.get_compiled_template(template_name)
+        content = self.render_template_bytes(template, variables)
         
         # Write file
         file_path = f"app/http/controllers/{self.get_snake_case(class_name)}.py"
         return self.write_file(file_path, content, options.get('force', False))
     
-    def _generate_resource_methods(self, model_class: str, api: bool, **options) -> str:
+    def _generate_resource_methods(self, model_class: str, model_variable: str, model_plural: str,
+                                   api: bool, **options) -> str:
         """Generate resource controller methods."""
-        model_variable = self.get_snake_case(model_class) if model_class else 'item'
-        model_plural = self.get_plural(model_variable)
+        return _build_resource_methods(model_class, model_variable, model_plural, api)
+    
+    def _model_import_line(self, model: str) -> str:
+        """Get the model import line, with its leading newline, or '' without a model."""
+        if not model:
+            return ""
         
-        methods = []
+        model_class = self.get_class_name(model)
+        return f"\nfrom app.models.{self.get_snake_case(model_class)} import {model_class}"
+    
+    def _generate_custom_methods(self, methods: List[Dict[str, str]]) -> str:
+        """Generate custom controller methods."""
+        if not methods:
+            return self._get_default_methods()
+        
+        buffer = io.StringIO()
+        for method_config in methods:
+            buffer.write(self._generate_custom_method(method_config))
+        
+        return buffer.getvalue()
+    
+    def _generate_custom_method(self, method_config: Dict[str, str]) -> str:
+        """Generate a single custom method."""
+        method_name = method_config.get('name')
+        description = method_config.get('description', f"Handle {method_name} request")
+        parameters = method_config.get('parameters', 'self, request: Request')
+        return_type = method_config.get('return_type', 'Response')
+        body = method_config.get('body', 'return Response("Method not implemented")')
         
-        # Index method
-        if api:
-            methods.append(f'''
+        if not method_name:
+            return ""
+        
+        docstring = self.format_docstring(
+            description,
+            args=(('request', 'The HTTP request'),),
+            returns=f"{return_type} object"
+        )
+        
+        return _CUSTOM_METHOD_TEMPLATE.format_map({
+            'docstring': docstring,
+            'name': method_name,
+            'parameters': parameters,
+            'return_type': return_type,
+            'body': body
+        })
+    
+    def _get_default_methods(self) -> str:
+        """Get default methods for basic controller."""
+        return '''
+    def index(self, request: Request) -> Response:
+        """
+        Display a listing of the resource.
+        
+        Args:
+            request: The HTTP request
+            
+        Returns:
+            HTTP response
+        """
+        return Response("Index method")
+    
+    def show(self, request: Request, id: str) -> Response:
+        """
+        Display the specified resource.
+        
+        Args:
+            request: The HTTP request
+            id: Resource ID
+            
+        Returns:
+            HTTP response
+        """
+        return Response(f"Show method for ID: {id}")'''
+    
+    def _load_templates(self):
+        """Load controller templates."""
+        self.templates.update(_TEMPLATES)
+        self._compiled_templates.update(_COMPILED_TEMPLATES)
+
+
+# Controller templates
+_BASIC_CONTROLLER_TEMPLATE = '''"""
+{{class_name}} Controller
+
+{{description}}
+"""
+
+from larapy.http.request import Request
+from larapy.http.response import Response{{model_import}}
+
+
+class {{class_name}}:
+    """
+    {{class_name}} for handling requests.
+    """{{methods}}
+'''
+
+_WEB_RESOURCE_CONTROLLER_TEMPLATE = '''"""
+{{class_name}} Controller
+
+Resource controller for {{model_class}} model.
+"""
+
+from larapy.http.request import Request
+from larapy.http.response import Response
+from larapy.view import view_response
+from larapy.http.redirect_response import redirect_response{{model_import}}
+
+
+class {{class_name}}:
+    """
+    {{class_name}} for handling {{model_class}} resource requests.
+    """{{resource_methods}}
+'''
+
+_API_RESOURCE_CONTROLLER_TEMPLATE = '''"""
+{{class_name}} API Controller
+
+API resource controller for {{model_class}} model.
+"""
+
+from larapy.http.request import Request
+from larapy.http.response import Response
+from larapy.http.json_response import JsonResponse{{model_import}}
+
+
+class {{class_name}}:
+    """
+    {{class_name}} for handling {{model_class}} API requests.
+    """{{resource_methods}}
+'''
+
+_TEMPLATES = MappingProxyType({
+    'basic_controller': _BASIC_CONTROLLER_TEMPLATE,
+    'web_resource_controller': _WEB_RESOURCE_CONTROLLER_TEMPLATE,
+    'api_resource_controller': _API_RESOURCE_CONTROLLER_TEMPLATE,
+})
+
+# Compiled once per process and shared by every generator instance
+_COMPILED_TEMPLATES = MappingProxyType(
+    {name: CompiledTemplate(source) for name, source in _TEMPLATES.items()}
+)
+
+
+# Resource controller method bodies keyed by (action, api). Web controllers
+# get the extra create/edit form actions; API controllers answer with JSON.
+_RESOURCE_METHOD_SOURCES = {
+    ('index', True): '''
     def index(self, request: Request) -> JsonResponse:
         """
         Display a listing of the resource.
@@ -103,14 +261,13 @@ class ControllerGenerator(BaseGenerator):
         Returns:
             JSON response with resource list
         """
-        {model_plural} = {model_class}.all() if "{model_class}" else []
+        {{ model_plural }} = {{ model_class }}.all() if "{{ model_class }}" else []
         
-        return JsonResponse({{
-            'data': [{model_variable}.to_dict() for {model_variable} in {model_plural}],
+        return JsonResponse({
+            'data': [{{ model_variable }}.to_dict() for {{ model_variable }} in {{ model_plural }}],
             'message': 'Resources retrieved successfully'
-        }})''')
-        else:
-            methods.append(f'''
+        })''',
+    ('index', False): '''
     def index(self, request: Request) -> Response:
         """
         Display a listing of the resource.
@@ -121,15 +278,12 @@ class ControllerGenerator(BaseGenerator):
         Returns:
             Response with resource list view
         """
-        {model_plural} = {model_class}.all() if "{model_class}" else []
-        
-        return view_response('{model_plural}.index', {{
-            '{model_plural}': {model_plural}
-        }})''')
+        {{ model_plural }} = {{ model_class }}.all() if "{{ model_class }}" else []
         
-        # Show method
-        if api:
-            methods.append(f'''
+        return view_response('{{ model_plural }}.index', {
+            '{{ model_plural }}': {{ model_plural }}
+        })''',
+    ('show', True): '''
     def show(self, request: Request, id: str) -> JsonResponse:
         """
         Display the specified resource.
@@ -141,19 +295,18 @@ class ControllerGenerator(BaseGenerator):
         Returns:
             JSON response with resource data
         """
-        {model_variable} = {model_class}.find(id) if "{model_class}" else None
+        {{ model_variable }} = {{ model_class }}.find(id) if "{{ model_class }}" else None
         
-        if not {model_variable}:
-            return JsonResponse({{
+        if not {{ model_variable }}:
+            return JsonResponse({
                 'error': 'Resource not found'
-            }}, status=404)
+            }, status=404)
         
-        return JsonResponse({{
-            'data': {model_variable}.to_dict(),
+        return JsonResponse({
+            'data': {{ model_variable }}.to_dict(),
             'message': 'Resource retrieved successfully'
-        }})''')
-        else:
-            methods.append(f'''
+        })''',
+    ('show', False): '''
     def show(self, request: Request, id: str) -> Response:
         """
         Display the specified resource.
@@ -165,18 +318,15 @@ class ControllerGenerator(BaseGenerator):
         Returns:
             Response with resource view
         """
-        {model_variable} = {model_class}.find(id) if "{model_class}" else None
+        {{ model_variable }} = {{ model_class }}.find(id) if "{{ model_class }}" else None
         
-        if not {model_variable}:
+        if not {{ model_variable }}:
             return Response('Resource not found', status=404)
         
-        return view_response('{model_plural}.show', {{
-            '{model_variable}': {model_variable}
-        }})''')
-        
-        # Create method (for web controllers)
-        if not api:
-            methods.append(f'''
+        return view_response('{{ model_plural }}.show', {
+            '{{ model_variable }}': {{ model_variable }}
+        })''',
+    ('create', False): '''
     def create(self, request: Request) -> Response:
         """
         Show the form for creating a new resource.
@@ -187,11 +337,8 @@ class ControllerGenerator(BaseGenerator):
         Returns:
             Response with create form
         """
-        return view_response('{model_plural}.create')''')
-        
-        # Store method
-        if api:
-            methods.append(f'''
+        return view_response('{{ model_plural }}.create')''',
+    ('store', True): '''
     def store(self, request: Request) -> JsonResponse:
         """
         Store a newly created resource.
@@ -206,19 +353,18 @@ class ControllerGenerator(BaseGenerator):
         data = request.json()
         
         # Create resource
-        {model_variable} = {model_class}.create(data) if "{model_class}" else None
+        {{ model_variable }} = {{ model_class }}.create(data) if "{{ model_class }}" else None
         
-        if not {model_variable}:
-            return JsonResponse({{
+        if not {{ model_variable }}:
+            return JsonResponse({
                 'error': 'Failed to create resource'
-            }}, status=500)
+            }, status=500)
         
-        return JsonResponse({{
-            'data': {model_variable}.to_dict(),
+        return JsonResponse({
+            'data': {{ model_variable }}.to_dict(),
             'message': 'Resource created successfully'
-        }}, status=201)''')
-        else:
-            methods.append(f'''
+        }, status=201)''',
+    ('store', False): '''
     def store(self, request: Request) -> Response:
         """
         Store a newly created resource.
@@ -233,16 +379,13 @@ class ControllerGenerator(BaseGenerator):
         data = request.input()
         
         # Create resource
-        {model_variable} = {model_class}.create(data) if "{model_class}" else None
+        {{ model_variable }} = {{ model_class }}.create(data) if "{{ model_class }}" else None
         
-        if not {model_variable}:
-            return redirect_response('{model_plural}.create').with_error('Failed to create resource')
+        if not {{ model_variable }}:
+            return redirect_response('{{ model_plural }}.create').with_error('Failed to create resource')
         
-        return redirect_response('{model_plural}.show', id={model_variable}.id).with_success('Resource created successfully')''')
-        
-        # Edit method (for web controllers)
-        if not api:
-            methods.append(f'''
+        return redirect_response('{{ model_plural }}.show', id={{ model_variable }}.id).with_success('Resource created successfully')''',
+    ('edit', False): '''
     def edit(self, request: Request, id: str) -> Response:
         """
         Show the form for editing the specified resource.
@@ -254,18 +397,15 @@ class ControllerGenerator(BaseGenerator):
         Returns:
             Response with edit form
         """
-        {model_variable} = {model_class}.find(id) if "{model_class}" else None
+        {{ model_variable }} = {{ model_class }}.find(id) if "{{ model_class }}" else None
         
-        if not {model_variable}:
+        if not {{ model_variable }}:
             return Response('Resource not found', status=404)
         
-        return view_response('{model_plural}.edit', {{
-            '{model_variable}': {model_variable}
-        }})''')
-        
-        # Update method
-        if api:
-            methods.append(f'''
+        return view_response('{{ model_plural }}.edit', {
+            '{{ model_variable }}': {{ model_variable }}
+        })''',
+    ('update', True): '''
     def update(self, request: Request, id: str) -> JsonResponse:
         """
         Update the specified resource.
@@ -277,23 +417,22 @@ class ControllerGenerator(BaseGenerator):
         Returns:
             JSON response with updated resource
         """
-        {model_variable} = {model_class}.find(id) if "{model_class}" else None
+        {{ model_variable }} = {{ model_class }}.find(id) if "{{ model_class }}" else None
         
-        if not {model_variable}:
-            return JsonResponse({{
+        if not {{ model_variable }}:
+            return JsonResponse({
                 'error': 'Resource not found'
-            }}, status=404)
+            }, status=404)
         
         # Update resource
         data = request.json()
-        {model_variable}.update(data)
+        {{ model_variable }}.update(data)
         
-        return JsonResponse({{
-            'data': {model_variable}.to_dict(),
+        return JsonResponse({
+            'data': {{ model_variable }}.to_dict(),
             'message': 'Resource updated successfully'
-        }})''')
-        else:
-            methods.append(f'''
+        })''',
+    ('update', False): '''
     def update(self, request: Request, id: str) -> Response:
         """
         Update the specified resource.
@@ -305,20 +444,17 @@ class ControllerGenerator(BaseGenerator):
         Returns:
             Redirect response
         """
-        {model_variable} = {model_class}.find(id) if "{model_class}" else None
+        {{ model_variable }} = {{ model_class }}.find(id) if "{{ model_class }}" else None
         
-        if not {model_variable}:
+        if not {{ model_variable }}:
             return Response('Resource not found', status=404)
         
         # Update resource
         data = request.input()
-        {model_variable}.update(data)
-        
-        return redirect_response('{model_plural}.show', id=id).with_success('Resource updated successfully')''')
+        {{ model_variable }}.update(data)
         
-        # Destroy method
-        if api:
-            methods.append(f'''
+        return redirect_response('{{ model_plural }}.show', id=id).with_success('Resource updated successfully')''',
+    ('destroy', True): '''
     def destroy(self, request: Request, id: str) -> JsonResponse:
         """
         Remove the specified resource.
@@ -330,21 +466,20 @@ class ControllerGenerator(BaseGenerator):
         Returns:
             JSON response confirming deletion
         """
-        {model_variable} = {model_class}.find(id) if "{model_class}" else None
+        {{ model_variable }} = {{ model_class }}.find(id) if "{{ model_class }}" else None
         
-        if not {model_variable}:
-            return JsonResponse({{
+        if not {{ model_variable }}:
+            return JsonResponse({
                 'error': 'Resource not found'
-            }}, status=404)
+            }, status=404)
         
         # Delete resource
-        {model_variable}.delete()
+        {{ model_variable }}.delete()
         
-        return JsonResponse({{
+        return JsonResponse({
             'message': 'Resource deleted successfully'
-        }})''')
-        else:
-            methods.append(f'''
+        })''',
+    ('destroy', False): '''
     def destroy(self, request: Request, id: str) -> Response:
         """
         Remove the specified resource.
@@ -356,130 +491,53 @@ class ControllerGenerator(BaseGenerator):
         Returns:
             Redirect response
         """
-        {model_variable} = {model_class}.find(id) if "{model_class}" else None
+        {{ model_variable }} = {{ model_class }}.find(id) if "{{ model_class }}" else None
         
-        if not {model_variable}:
+        if not {{ model_variable }}:
             return Response('Resource not found', status=404)
         
         # Delete resource
-        {model_variable}.delete()
+        {{ model_variable }}.delete()
         
-        return redirect_response('{model_plural}.index').with_success('Resource deleted successfully')''')
-        
-        return ''.join(methods)
-    
-    def _generate_custom_methods(self, methods: List[Dict[str, str]]) -> str:
-        """Generate custom controller methods."""
-        if not methods:
-            return self._get_default_methods()
-        
-        method_lines = []
-        for method_config in methods:
-            method = self._generate_custom_method(method_config)
-            if method:
-                method_lines.append(method)
-        
-        return ''.join(method_lines)
-    
-    def _generate_custom_method(self, method_config: Dict[str, str]) -> str:
-        """Generate a single custom method."""
-        method_name = method_config.get('name')
-        description = method_config.get('description', f"Handle {method_name} request")
-        parameters = method_config.get('parameters', 'self, request: Request')
-        return_type = method_config.get('return_type', 'Response')
-        body = method_config.get('body', 'return Response("Method not implemented")')
-        
-        if not method_name:
-            return ""
-        
-        docstring = self.format_docstring(
-            description,
-            args=[('request', 'The HTTP request')],
-            returns=f"{return_type} object"
-        )
-        
-        return f"""
-{docstring}
-    def {method_name}({parameters}) -> {return_type}:
-        {body}"""
-    
-    def _get_default_methods(self) -> str:
-        """Get default methods for basic controller."""
-        return '''
-    def index(self, request: Request) -> Response:
-        """
-        Display a listing of the resource.
-        
-        Args:
-            request: The HTTP request
-            
-        Returns:
-            HTTP response
-        """
-        return Response("Index method")
-    
-    def show(self, request: Request, id: str) -> Response:
-        """
-        Display the specified resource.
-        
-        Args:
-            request: The HTTP request
-            id: Resource ID
-            
-        Returns:
-            HTTP response
-        """
-        return Response(f"Show method for ID: {id}")'''
-    
-    def _load_templates(self):
-        """Load controller templates."""
-        self.templates['basic_controller'] = '''"""
-{{class_name}} Controller
-
-{{description}}
-"""
-
-from larapy.http.request import Request
-from larapy.http.response import Response{{model_class and '\n' + model_import or ''}}
-
-
-class {{class_name}}:
-    """
-    {{class_name}} for handling requests.
-    """{{methods}}
-'''
+        return redirect_response('{{ model_plural }}.index').with_success('Resource deleted successfully')''',
+}
 
-        self.templates['web_resource_controller'] = '''"""
-{{class_name}} Controller
+# Actions emitted for API and web resource controllers, in order
+_RESOURCE_ACTIONS = {
+    True: ('index', 'show', 'store', 'update', 'destroy'),
+    False: ('index', 'show', 'create', 'store', 'edit', 'update', 'destroy'),
+}
 
-Resource controller for {{model_class}} model.
-"""
-
-from larapy.http.request import Request
-from larapy.http.response import Response
-from larapy.view import view_response
-from larapy.http.redirect_response import redirect_response{{model_class and '\n' + model_import or ''}}
+# One template per controller flavour, assembled and compiled once at import
+# (or loaded from the precompiled modules)
+_RESOURCE_METHODS_TEMPLATES = {
+    api: compile_template(
+        'resource_methods_api' if api else 'resource_methods_web',
+        ''.join(_RESOURCE_METHOD_SOURCES[(action, api)] for action in actions)
+    )
+    for api, actions in _RESOURCE_ACTIONS.items()
+}
 
 
-class {{class_name}}:
+@lru_cache(maxsize=256)
+def _build_resource_methods(model_class: str, model_variable: str, model_plural: str, api: bool) -> str:
     """
-    {{class_name}} for handling {{model_class}} resource requests.
-    """{{resource_methods}}
-'''
-
-        self.templates['api_resource_controller'] = '''"""
-{{class_name}} API Controller
-
-API resource controller for {{model_class}} model.
-"""
-
-from larapy.http.request import Request
-from larapy.http.response import Response
-from larapy.http.json_response import JsonResponse{{model_class and '\n' + model_import or ''}}
-
-
-class {{class_name}}:
+    Build the resource controller method definitions.
+    
+    The output depends only on the arguments, so scaffolding several
+    controllers in one run reuses the rendered string.
+    
+    Args:
+        model_class: Model class name (may be empty)
+        model_variable: Singular snake_case variable name
+        model_plural: Plural snake_case variable name
+        api: Whether to build JSON API methods instead of web methods
+        
+    Returns:
+        Concatenated method definitions
     """
-    {{class_name}} for handling {{model_class}} API requests.
-    """{{resource_methods}}
-'''
\ No newline at end of file
+    return _RESOURCE_METHODS_TEMPLATES[api].render(
+        model_class=model_class,
+        model_variable=model_variable,
+        model_plural=model_plural
+    )
@@ -4,9 +4,11 @@ Factory Generator
 Generates model factory classes for Larapy applications.
 """
 
+import io
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
-from .base_generator import BaseGenerator
+from .base_generator import BaseGenerator, CompiledTemplate
 
 
 class FactoryGenerator(BaseGenerator):
@@ -49,8 +51,8 @@ class FactoryGenerator(BaseGenerator):
         }
         
         # Render template
-        template_content = self.get_template('factory')
-        content = self.render_template(template_content, variables)
+        template = self.get_compiled_template('factory')
+        content = self.render_template_bytes(template, variables)
         
         # Write file
         file_path = f"database/factories/{self.get_snake_case(factory_class)}.py"
@@ -70,84 +72,11 @@ class FactoryGenerator(BaseGenerator):
         """Generate default factory definition based on model name."""
         model_lower = model_class.lower()
         
-        fields = []
-        
         # Common patterns based on model type
-        if 'user' in model_lower:
-            fields.extend([
-                "'name': fake.name()",
-                "'email': fake.unique().email()",
-                "'password': fake.password(length=12)",
-                "'email_verified_at': fake.date_time_between(start_date='-1y', end_date='now')",
-                "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
-                "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')"
-            ])
-        
-        elif 'post' in model_lower or 'article' in model_lower:
-            fields.extend([
-                "'title': fake.sentence(nb_words=4)",
-                "'slug': fake.slug()",
-                "'content': fake.text(max_nb_chars=2000)",
-                "'excerpt': fake.text(max_nb_chars=200)",
-                "'status': fake.random_element(['draft', 'published', 'archived'])",
-                "'published_at': fake.date_time_between(start_date='-1y', end_date='now')",
-                "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
-                "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')"
-            ])
-        
-        elif 'product' in model_lower:
-            fields.extend([
-                "'name': fake.word().capitalize() + ' ' + fake.word().capitalize()",
-                "'description': fake.text(max_nb_chars=500)",
-                "'sku': fake.unique().bothify(text='SKU-########')",
-                "'price': fake.pydecimal(left_digits=3, right_digits=2, positive=True)",
-                "'cost': fake.pydecimal(left_digits=2, right_digits=2, positive=True)",
-                "'stock_quantity': fake.random_int(min=0, max=100)",
-                "'in_stock': fake.boolean(chance_of_getting_true=80)",
-                "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
-                "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')"
-            ])
-        
-        elif 'category' in model_lower:
-            fields.extend([
-                "'name': fake.word().capitalize()",
-                "'slug': fake.slug()",
-                "'description': fake.text(max_nb_chars=300)",
-                "'sort_order': fake.random_int(min=1, max=100)",
-                "'is_active': fake.boolean(chance_of_getting_true=90)",
-                "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
-                "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')"
-            ])
-        
-        elif 'comment' in model_lower:
-            fields.extend([
-                "'content': fake.text(max_nb_chars=500)",
-                "'author_name': fake.name()",
-                "'author_email': fake.email()",
-                "'is_approved': fake.boolean(chance_of_getting_true=75)",
-                "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
-                "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')"
-            ])
-        
-        elif 'order' in model_lower:
-            fields.extend([
-                "'order_number': fake.unique().bothify(text='ORD-########')",
-                "'total_amount': fake.pydecimal(left_digits=4, right_digits=2, positive=True)",
-                "'status': fake.random_element(['pending', 'processing', 'shipped', 'delivered', 'cancelled'])",
-                "'currency': fake.currency_code()",
-                "'notes': fake.text(max_nb_chars=200)",
-                "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
-                "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')"
-            ])
-        
-        else:
-            # Generic fields
-            fields.extend([
-                "'name': fake.word().capitalize()",
-                "'description': fake.text(max_nb_chars=300)",
-                "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
-                "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')"
-            ])
+        fields = next(
+            (table for keyword, table in _FIELD_TABLES.items() if keyword in model_lower),
+            _GENERIC_FIELDS
+        )
         
         # Format as dictionary
         formatted_fields = ',\n            '.join(fields)
@@ -157,11 +86,9 @@ class FactoryGenerator(BaseGenerator):
     
     def _format_custom_definition(self, definition: Dict[str, str]) -> str:
         """Format custom factory definition."""
-        fields = []
-        for field_name, faker_expression in definition.items():
-            fields.append(f"'{field_name}': {faker_expression}")
-        
-        formatted_fields = ',\n            '.join(fields)
+        formatted_fields = ',\n            '.join(
+            f"'{field_name}': {faker_expression}" for field_name, faker_expression in definition.items()
+        )
         return f"""{{
             {formatted_fields}
         }}"""
@@ -171,23 +98,23 @@ class FactoryGenerator(BaseGenerator):
         if not states:
             return ""
         
-        state_methods = []
+        buffer = io.StringIO()
+        separator = ""
         for state_name, state_definition in states.items():
-            state_method = self._generate_state_method(state_name, state_definition)
-            state_methods.append(state_method)
+            buffer.write(separator)
+            buffer.write(self._generate_state_method(state_name, state_definition))
+            separator = "\n"
         
-        return '\n'.join(state_methods)
+        return buffer.getvalue()
     
     def _generate_state_method(self, state_name: str, state_definition: Dict[str, str]) -> str:
         """Generate a single state method."""
         method_name = self.get_snake_case(state_name)
         
         # Format state fields
-        fields = []
-        for field_name, faker_expression in state_definition.items():
-            fields.append(f"'{field_name}': {faker_expression}")
-        
-        formatted_fields = ',\n            '.join(fields)
+        formatted_fields = ',\n            '.join(
+            f"'{field_name}': {faker_expression}" for field_name, faker_expression in state_definition.items()
+        )
         
         docstring = self.format_docstring(
             f"Create {state_name} state for the model.",
@@ -206,13 +133,16 @@ class FactoryGenerator(BaseGenerator):
         if not relationships:
             return ""
         
-        relationship_methods = []
+        buffer = io.StringIO()
+        separator = ""
         for rel in relationships:
             rel_method = self._generate_relationship_method(rel)
             if rel_method:
-                relationship_methods.append(rel_method)
+                buffer.write(separator)
+                buffer.write(rel_method)
+                separator = "\n"
         
-        return '\n'.join(relationship_methods)
+        return buffer.getvalue()
     
     def _generate_relationship_method(self, relationship: Dict[str, str]) -> str:
         """Generate a factory relationship method."""
@@ -223,7 +153,8 @@ class FactoryGenerator(BaseGenerator):
         if not rel_name or not rel_factory:
             return ""
         
-        method_name = f"with_{self.get_snake_case(rel_name)}"
+        snake_name = self.get_snake_case(rel_name)
+        method_name = f"with_{snake_name}"
         factory_class = self.get_class_name(rel_factory)
         
         if rel_type == 'belongs_to':
@@ -234,32 +165,120 @@ class FactoryGenerator(BaseGenerator):
             
             return f"""
 {docstring}
-    def {method_name}(self, {self.get_snake_case(rel_name)}=None):
-        if {self.get_snake_case(rel_name)} is None:
-            {self.get_snake_case(rel_name)} = {factory_class}.create()
+    def {method_name}(self, {snake_name}=None):
+        if {snake_name} is None:
+            {snake_name} = {factory_class}.create()
         
         return self.state({{
-            '{self.get_snake_case(rel_name)}_id': {self.get_snake_case(rel_name)}.id
+            '{snake_name}_id': {snake_name}.id
         }})"""
         
         elif rel_type == 'has_many':
             docstring = self.format_docstring(
                 f"Create factory that will have {rel_name} after creation.",
-                args=[('count', 'Number of related records to create')],
+                args=(('count', 'Number of related records to create'),),
                 returns="Factory instance"
             )
             
+            singular_name = self.get_snake_case(rel_name.rstrip('s'))
+            
             return f"""
 {docstring}
-    def with_{self.get_snake_case(rel_name)}(self, count=3):
+    def {method_name}(self, count=3):
         return self.after_creating(lambda model: 
-            {factory_class}.count(count).create({{'{self.get_snake_case(rel_name.rstrip('s'))}_id': model.id}}))"""
+            {factory_class}.count(count).create({{'{singular_name}_id': model.id}}))"""
         
         return ""
     
     def _load_templates(self):
         """Load factory templates."""
-        self.templates['factory'] = '''"""
+        self.templates.update(_TEMPLATES)
+        self._compiled_templates.update(_COMPILED_TEMPLATES)
+
+
+# Default factory fields for common model types
+_USER_FIELDS = (
+    "'name': fake.name()",
+    "'email': fake.unique().email()",
+    "'password': fake.password(length=12)",
+    "'email_verified_at': fake.date_time_between(start_date='-1y', end_date='now')",
+    "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
+    "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')",
+)
+
+_POST_FIELDS = (
+    "'title': fake.sentence(nb_words=4)",
+    "'slug': fake.slug()",
+    "'content': fake.text(max_nb_chars=2000)",
+    "'excerpt': fake.text(max_nb_chars=200)",
+    "'status': fake.random_element(['draft', 'published', 'archived'])",
+    "'published_at': fake.date_time_between(start_date='-1y', end_date='now')",
+    "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
+    "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')",
+)
+
+_PRODUCT_FIELDS = (
+    "'name': fake.word().capitalize() + ' ' + fake.word().capitalize()",
+    "'description': fake.text(max_nb_chars=500)",
+    "'sku': fake.unique().bothify(text='SKU-########')",
+    "'price': fake.pydecimal(left_digits=3, right_digits=2, positive=True)",
+    "'cost': fake.pydecimal(left_digits=2, right_digits=2, positive=True)",
+    "'stock_quantity': fake.random_int(min=0, max=100)",
+    "'in_stock': fake.boolean(chance_of_getting_true=80)",
+    "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
+    "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')",
+)
+
+_CATEGORY_FIELDS = (
+    "'name': fake.word().capitalize()",
+    "'slug': fake.slug()",
+    "'description': fake.text(max_nb_chars=300)",
+    "'sort_order': fake.random_int(min=1, max=100)",
+    "'is_active': fake.boolean(chance_of_getting_true=90)",
+    "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
+    "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')",
+)
+
+_COMMENT_FIELDS = (
+    "'content': fake.text(max_nb_chars=500)",
+    "'author_name': fake.name()",
+    "'author_email': fake.email()",
+    "'is_approved': fake.boolean(chance_of_getting_true=75)",
+    "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
+    "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')",
+)
+
+_ORDER_FIELDS = (
+    "'order_number': fake.unique().bothify(text='ORD-########')",
+    "'total_amount': fake.pydecimal(left_digits=4, right_digits=2, positive=True)",
+    "'status': fake.random_element(['pending', 'processing', 'shipped', 'delivered', 'cancelled'])",
+    "'currency': fake.currency_code()",
+    "'notes': fake.text(max_nb_chars=200)",
+    "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
+    "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')",
+)
+
+_GENERIC_FIELDS = (
+    "'name': fake.word().capitalize()",
+    "'description': fake.text(max_nb_chars=300)",
+    "'created_at': fake.date_time_between(start_date='-1y', end_date='now')",
+    "'updated_at': fake.date_time_between(start_date='-6m', end_date='now')",
+)
+
+# Model name keywords, checked in order; the first one found picks the fields
+_FIELD_TABLES = {
+    'user': _USER_FIELDS,
+    'post': _POST_FIELDS,
+    'article': _POST_FIELDS,
+    'product': _PRODUCT_FIELDS,
+    'category': _CATEGORY_FIELDS,
+    'comment': _COMMENT_FIELDS,
+    'order': _ORDER_FIELDS,
+}
+
+
+# Factory templates
+_FACTORY_TEMPLATE = '''"""
 {{model_class}} Factory
 
 Model factory for generating {{model_class}} instances.
@@ -294,4 +313,13 @@ class {{factory_class}}(Factory):
         """Callback after creating a model instance."""
         # Add any logic that should run after creating (persisting) a model
         pass
-'''
\ No newline at end of file
+'''
+
+_TEMPLATES = MappingProxyType({
+    'factory': _FACTORY_TEMPLATE,
+})
+
+# Compiled once per process and shared by every generator instance
+_COMPILED_TEMPLATES = MappingProxyType(
+    {name: CompiledTemplate(source) for name, source in _TEMPLATES.items()}
+)
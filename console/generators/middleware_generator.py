@@ -5,13 +5,45 @@ Generates middleware classes for Larapy applications.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from .base_generator import BaseGenerator
+from types import MappingProxyType
+from typing import Dict, Iterable, Optional, Any, Tuple
+from .base_generator import BaseGenerator, CompiledTemplate
+
+
+# Generated middleware modules are written to _MIDDLEWARE_DIR + name + _PY_SUFFIX
+_MIDDLEWARE_DIR = "app/http/middleware/"
+_PY_SUFFIX = ".py"
+
+
+# Rendered middleware modules keyed by _render_cache_key(), oldest evicted first
+_RENDER_CACHE: Dict[tuple, bytes] = {}
+_RENDER_CACHE_SIZE = 256
+
+
+def _python_list(items: Iterable[str]) -> str:
+    """Render strings as a Python list literal for a generated module."""
+    return "[" + ", ".join(map(repr, items)) + "]"
+
+
+# List literals for the default option values, so the common case formats nothing
+_EMPTY_LIST = "[]"
+_WILDCARD_LIST = "['*']"
+_DEFAULT_METHODS_LIST = "['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS']"
+_DEFAULT_VARY_HEADERS_LIST = "['Accept', 'Accept-Encoding']"
 
 
 class MiddlewareGenerator(BaseGenerator):
     """Generates middleware classes."""
     
+    # Middleware type to (template name, template variables builder)
+    _TYPE_SPECS = {
+        'basic': ('basic_middleware', '_basic_variables'),
+        'auth': ('auth_middleware', '_auth_variables'),
+        'cors': ('cors_middleware', '_cors_variables'),
+        'rate_limit': ('rate_limit_middleware', '_rate_limit_variables'),
+        'cache': ('cache_middleware', '_cache_variables')
+    }
+    
     def __init__(self):
         super().__init__()
         self._load_templates()
@@ -33,135 +65,134 @@ class MiddlewareGenerator(BaseGenerator):
         
         # Determine middleware type
         middleware_type = options.get('type', 'basic')
+        template_name, builder = self._TYPE_SPECS.get(middleware_type, self._TYPE_SPECS['basic'])
+        file_path = _MIDDLEWARE_DIR + self.get_snake_case(class_name) + _PY_SUFFIX
+        force = options.get('force', False)
+        
+        # Identical requests against the stock templates render identical files
+        cache_key = self._render_cache_key(template_name, class_name, options)
+        content = _RENDER_CACHE.get(cache_key) if cache_key is not None else None
+        
+        if content is None:
+            variables = getattr(self, builder)(class_name, options)
+            template = self.get_compiled_template(template_name)
+            content = self.render_template_bytes(template, variables)
+            
+            if cache_key is not None:
+                if len(_RENDER_CACHE) >= _RENDER_CACHE_SIZE:
+                    del _RENDER_CACHE[next(iter(_RENDER_CACHE))]
+                _RENDER_CACHE[cache_key] = content
         
-        if middleware_type == 'auth':
-            return self._generate_auth_middleware(class_name, **options)
-        elif middleware_type == 'cors':
-            return self._generate_cors_middleware(class_name, **options)
-        elif middleware_type == 'rate_limit':
-            return self._generate_rate_limit_middleware(class_name, **options)
-        elif middleware_type == 'cache':
-            return self._generate_cache_middleware(class_name, **options)
-        else:
-            return self._generate_basic_middleware(class_name, **options)
+        return self.write_file(file_path, content, force)
     
-    def _generate_basic_middleware(self, class_name: str, **options) -> bool:
-        """Generate a basic middleware."""
-        # Set template variables
-        variables = {
+    def generate_many(self, specs: Iterable[Tuple[str, Dict[str, Any]]]) -> bool:
+        """
+        Generate several middleware classes and write them in one batch.
+        
+        Args:
+            specs: Iterable of (name, options) tuples
+            
+        Returns:
+            True if every middleware was generated successfully
+        """
+        self.enable_batching()
+        success = True
+        try:
+            for name, options in specs:
+                success = self.generate(name, **options) and success
+        finally:
+            # Write whatever was rendered, even if a later spec failed
+            success = self.flush_batch() and success
+        
+        return success
+    
+    def _render_cache_key(self, template_name: str, class_name: str,
+                          options: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Get the render cache key for a middleware, if its output can be cached.
+        
+        Args:
+            template_name: Name of the template to render
+            class_name: Middleware class name
+            options: Generation options
+            
+        Returns:
+            Cache key, or None for replaced templates, instance variables or
+            unhashable options
+        """
+        if self.variables or self.templates.get(template_name) is not _TEMPLATES[template_name]:
+            return None
+        
+        key = (template_name, class_name,
+               tuple(sorted(item for item in options.items() if item[0] != 'force')))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        
+        return key
+    
+    def _basic_variables(self, class_name: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the template variables for a basic middleware."""
+        return {
             'class_name': class_name,
             'description': options.get('description', f"{class_name} for handling HTTP requests"),
             'before_logic': options.get('before_logic', '# Add before logic here\n        pass'),
             'after_logic': options.get('after_logic', '# Add after logic here\n        pass')
         }
-        
-        # Render template
-        template_content = self.get_template('basic_middleware')
-        content = self.render_template(template_content, variables)
-        
-        # Write file
-        file_path = f"app/http/middleware/{self.get_snake_case(class_name)}.py"
-        return self.write_file(file_path, content, options.get('force', False))
     
-    def _generate_auth_middleware(self, class_name: str, **options) -> bool:
-        """Generate an authentication middleware."""
-        # Set template variables
-        variables = {
+    def _auth_variables(self, class_name: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the template variables for an authentication middleware."""
+        return {
             'class_name': class_name,
             'guard': options.get('guard', 'web'),
             'redirect_to': options.get('redirect_to', '/login'),
-            'except_routes': self._format_except_routes(options.get('except', []))
+            'except_routes': _python_list(options['except']) if 'except' in options else _EMPTY_LIST
         }
-        
-        # Render template
-        template_content = self.get_template('auth_middleware')
-        content = self.render_template(template_content, variables)
-        
-        # Write file
-        file_path = f"app/http/middleware/{self.get_snake_case(class_name)}.py"
-        return self.write_file(file_path, content, options.get('force', False))
     
-    def _generate_cors_middleware(self, class_name: str, **options) -> bool:
-        """Generate a CORS middleware."""
-        # Set template variables
-        variables = {
+    def _cors_variables(self, class_name: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the template variables for a CORS middleware."""
+        return {
             'class_name': class_name,
-            'allowed_origins': self._format_origins(options.get('origins', ['*'])),
-            'allowed_methods': self._format_methods(options.get('methods', ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'])),
-            'allowed_headers': self._format_headers(options.get('headers', ['*'])),
+            'allowed_origins': _python_list(options['origins']) if 'origins' in options else _WILDCARD_LIST,
+            'allowed_methods': (_python_list(map(str.upper, options['methods']))
+                                if 'methods' in options else _DEFAULT_METHODS_LIST),
+            'allowed_headers': _python_list(options['headers']) if 'headers' in options else _WILDCARD_LIST,
             'max_age': options.get('max_age', 86400)
         }
-        
-        # Render template
-        template_content = self.get_template('cors_middleware')
-        content = self.render_template(template_content, variables)
-        
-        # Write file
-        file_path = f"app/http/middleware/{self.get_snake_case(class_name)}.py"
-        return self.write_file(file_path, content, options.get('force', False))
     
-    def _generate_rate_limit_middleware(self, class_name: str, **options) -> bool:
-        """Generate a rate limiting middleware."""
-        # Set template variables
-        variables = {
+    def _rate_limit_variables(self, class_name: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the template variables for a rate limiting middleware."""
+        return {
             'class_name': class_name,
             'max_attempts': options.get('max_attempts', 60),
             'decay_minutes': options.get('decay_minutes', 1),
             'key_generator': options.get('key_generator', 'ip')
         }
-        
-        # Render template
-        template_content = self.get_template('rate_limit_middleware')
-        content = self.render_template(template_content, variables)
-        
-        # Write file
-        file_path = f"app/http/middleware/{self.get_snake_case(class_name)}.py"
-        return self.write_file(file_path, content, options.get('force', False))
     
-    def _generate_cache_middleware(self, class_name: str, **options) -> bool:
-        """Generate a cache middleware."""
-        # Set template variables
-        variables = {
+    def _cache_variables(self, class_name: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the template variables for a cache middleware."""
+        return {
             'class_name': class_name,
             'cache_time': options.get('cache_time', 3600),
             'cache_key_prefix': options.get('cache_key_prefix', 'http_cache'),
-            'vary_headers': self._format_headers(options.get('vary_headers', ['Accept', 'Accept-Encoding']))
+            'vary_headers': (_python_list(options['vary_headers'])
+                             if 'vary_headers' in options else _DEFAULT_VARY_HEADERS_LIST)
         }
-        
-        # Render template
-        template_content = self.get_template('cache_middleware')
-        content = self.render_template(template_content, variables)
-        
-        # Write file
-        file_path = f"app/http/middleware/{self.get_snake_case(class_name)}.py"
-        return self.write_file(file_path, content, options.get('force', False))
-    
-    def _format_except_routes(self, routes: List[str]) -> str:
-        """Format except routes for template."""
-        if not routes:
-            return "[]"
-        
-        formatted_routes = [f"'{route}'" for route in routes]
-        return f"[{', '.join(formatted_routes)}]"
-    
-    def _format_origins(self, origins: List[str]) -> str:
-        """Format CORS origins for template."""
-        formatted_origins = [f"'{origin}'" for origin in origins]
-        return f"[{', '.join(formatted_origins)}]"
-    
-    def _format_methods(self, methods: List[str]) -> str:
-        """Format HTTP methods for template."""
-        formatted_methods = [f"'{method.upper()}'" for method in methods]
-        return f"[{', '.join(formatted_methods)}]"
-    
-    def _format_headers(self, headers: List[str]) -> str:
-        """Format headers for template."""
-        formatted_headers = [f"'{header}'" for header in headers]
-        return f"[{', '.join(formatted_headers)}]"
     
     def _load_templates(self):
-        """Load middleware templates."""
-        self.templates['basic_middleware'] = '''"""
+        """
+        Load middleware templates.
+        
+        Every instance shares the read-only module mapping; to customize a
+        template, assign a new mapping (e.g. {**generator.templates, name: source}).
+        """
+        self.templates = _TEMPLATES
+        self._compiled_templates.update(_COMPILED_TEMPLATES)
+
+
+# Middleware templates
+_BASIC_MIDDLEWARE_TEMPLATE = '''"""
 {{class_name}} HTTP Middleware
 
 {{description}}
@@ -200,7 +231,7 @@ class {{class_name}}:
         return response
 '''
 
-        self.templates['auth_middleware'] = '''"""
+_AUTH_MIDDLEWARE_TEMPLATE = '''"""
 {{class_name}} Authentication Middleware
 
 Ensures the request is authenticated before proceeding.
@@ -218,6 +249,8 @@ class {{class_name}}:
     {{class_name}} for authenticating HTTP requests.
     """
     
+    __slots__ = ('guard', 'redirect_to', 'except_routes')
+    
     def __init__(self):
         self.guard = '{{guard}}'
         self.redirect_to = '{{redirect_to}}'
@@ -274,7 +307,7 @@ class {{class_name}}:
         return RedirectResponse(self.redirect_to)
 '''
 
-        self.templates['cors_middleware'] = '''"""
+_CORS_MIDDLEWARE_TEMPLATE = '''"""
 {{class_name}} CORS Middleware
 
 Handles Cross-Origin Resource Sharing (CORS) for HTTP requests.
@@ -290,6 +323,8 @@ class {{class_name}}:
     {{class_name}} for handling CORS requests.
     """
     
+    __slots__ = ('allowed_origins', 'allowed_methods', 'allowed_headers', 'max_age')
+    
     def __init__(self):
         self.allowed_origins = {{allowed_origins}}
         self.allowed_methods = {{allowed_methods}}
@@ -351,7 +386,7 @@ class {{class_name}}:
         return origin in self.allowed_origins or '*' in self.allowed_origins
 '''
 
-        self.templates['rate_limit_middleware'] = '''"""
+_RATE_LIMIT_MIDDLEWARE_TEMPLATE = '''"""
 {{class_name}} Rate Limiting Middleware
 
 Limits the rate of requests from clients.
@@ -361,20 +396,38 @@ from larapy.http.request import Request
 from larapy.http.response import Response
 from larapy.http.json_response import JsonResponse
 from typing import Callable
+from collections import deque
+from functools import lru_cache
+import math
 import time
 import hashlib
 
+try:
+    # Much faster than MD5; the keys are internal and need no cryptographic strength
+    from xxhash import xxh3_64_hexdigest as _hash_key
+except ImportError:
+    def _hash_key(data: bytes) -> str:
+        return hashlib.md5(data).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _rate_limit_key(identifier: str) -> str:
+    """Hash a client identifier into its rate limit key (memoized per identifier)."""
+    return _hash_key(f"rate_limit:{identifier}".encode())
+
 
 class {{class_name}}:
     """
     {{class_name}} for rate limiting HTTP requests.
     """
     
+    __slots__ = ('max_attempts', 'decay_minutes', 'key_generator', 'cache')
+    
     def __init__(self):
         self.max_attempts = {{max_attempts}}
         self.decay_minutes = {{decay_minutes}}
         self.key_generator = '{{key_generator}}'
-        self.cache = {}  # Simple in-memory cache (use Redis in production)
+        self.cache = {}  # Attempt timestamps per key, in memory (use Redis in production)
     
     def handle(self, request: Request, next_handler: Callable) -> Response:
         """
@@ -412,30 +465,29 @@ class {{class_name}}:
         else:
             identifier = request.client_ip
         
-        # Create a hash of the identifier
-        return hashlib.md5(f"rate_limit:{identifier}".encode()).hexdigest()
+        # Hash the identifier; repeat clients hit the memoized key
+        return _rate_limit_key(identifier)
     
     def _too_many_attempts(self, key: str) -> bool:
         """Check if too many attempts have been made."""
-        now = int(time.time())
-        window_start = now - (self.decay_minutes * 60)
+        attempts = self.cache.get(key)
+        if not attempts:
+            return False
         
-        # Clean old entries
-        if key in self.cache:
-            attempts = self.cache[key]
-            self.cache[key] = [timestamp for timestamp in attempts if timestamp > window_start]
-            return len(self.cache[key]) >= self.max_attempts
+        # Clean old entries; attempts are kept oldest first
+        window_start = time.monotonic() - (self.decay_minutes * 60)
+        while attempts and attempts[0] <= window_start:
+            attempts.popleft()
         
-        return False
+        return len(attempts) >= self.max_attempts
     
     def _increment_attempts(self, key: str) -> None:
         """Increment the attempt count for the key."""
-        now = int(time.time())
-        
-        if key not in self.cache:
-            self.cache[key] = []
+        attempts = self.cache.get(key)
+        if attempts is None:
+            attempts = self.cache[key] = deque()
         
-        self.cache[key].append(now)
+        attempts.append(time.monotonic())
     
     def _rate_limit_response(self, key: str) -> JsonResponse:
         """Return rate limit exceeded response."""
@@ -453,18 +505,17 @@ class {{class_name}}:
     
     def _get_retry_after(self, key: str) -> int:
         """Get seconds until rate limit resets."""
-        if key not in self.cache or not self.cache[key]:
+        attempts = self.cache.get(key)
+        if not attempts:
             return 0
         
-        oldest_attempt = min(self.cache[key])
-        reset_time = oldest_attempt + (self.decay_minutes * 60)
-        now = int(time.time())
+        reset_time = attempts[0] + (self.decay_minutes * 60)
         
-        return max(0, reset_time - now)
+        return max(0, math.ceil(reset_time - time.monotonic()))
     
     def _add_rate_limit_headers(self, response: Response, key: str) -> Response:
         """Add rate limit headers to response."""
-        remaining = max(0, self.max_attempts - len(self.cache.get(key, [])))
+        remaining = max(0, self.max_attempts - len(self.cache.get(key, ())))
         retry_after = self._get_retry_after(key)
         
         response.headers['X-RateLimit-Limit'] = str(self.max_attempts)
@@ -474,7 +525,7 @@ class {{class_name}}:
         return response
 '''
 
-        self.templates['cache_middleware'] = '''"""
+_CACHE_MIDDLEWARE_TEMPLATE = '''"""
 {{class_name}} HTTP Cache Middleware
 
 Caches HTTP responses to improve performance.
@@ -483,15 +534,33 @@ Caches HTTP responses to improve performance.
 from larapy.http.request import Request
 from larapy.http.response import Response
 from typing import Callable
+from functools import lru_cache
 import hashlib
 import time
 
+try:
+    # Much faster than MD5; the keys are internal and need no cryptographic strength
+    from xxhash import xxh3_64_hexdigest as _hash_key
+except ImportError:
+    def _hash_key(data: bytes) -> str:
+        return hashlib.md5(data).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _cache_key(prefix: str, method: str, path: str, query_string: str, headers: tuple) -> str:
+    """Hash the request components into a cache key (memoized per combination)."""
+    key_parts = [prefix, method, path, query_string]
+    key_parts.extend(f"{header_name}:{header_value}" for header_name, header_value in headers)
+    return _hash_key('|'.join(key_parts).encode())
+
 
 class {{class_name}}:
     """
     {{class_name}} for caching HTTP responses.
     """
     
+    __slots__ = ('cache_time', 'cache_key_prefix', 'vary_headers', 'cache')
+    
     def __init__(self):
         self.cache_time = {{cache_time}}  # seconds
         self.cache_key_prefix = '{{cache_key_prefix}}'
@@ -533,22 +602,19 @@ class {{class_name}}:
     
     def _generate_cache_key(self, request: Request) -> str:
         """Generate cache key for the request."""
-        # Base key components
-        key_parts = [
+        # Vary header values as a hashable tuple, so the key can be memoized
+        headers = tuple(
+            (header_name, request.headers.get(header_name, ''))
+            for header_name in self.vary_headers
+        )
+        
+        return _cache_key(
             self.cache_key_prefix,
             request.method,
             request.path,
-            request.query_string or ''
-        ]
-        
-        # Add vary headers to key
-        for header_name in self.vary_headers:
-            header_value = request.headers.get(header_name, '')
-            key_parts.append(f"{header_name}:{header_value}")
-        
-        # Create hash
-        key_string = '|'.join(key_parts)
-        return hashlib.md5(key_string.encode()).hexdigest()
+            request.query_string or '',
+            headers
+        )
     
     def _get_cached_response(self, cache_key: str):
         """Get cached response if it exists and is not expired."""
@@ -617,4 +683,17 @@ class {{class_name}}:
             response.headers['Vary'] = ', '.join(self.vary_headers)
         
         return response
-'''
\ No newline at end of file
+'''
+
+_TEMPLATES = MappingProxyType({
+    'basic_middleware': _BASIC_MIDDLEWARE_TEMPLATE,
+    'auth_middleware': _AUTH_MIDDLEWARE_TEMPLATE,
+    'cors_middleware': _CORS_MIDDLEWARE_TEMPLATE,
+    'rate_limit_middleware': _RATE_LIMIT_MIDDLEWARE_TEMPLATE,
+    'cache_middleware': _CACHE_MIDDLEWARE_TEMPLATE,
+})
+
+# Compiled once per process and shared by every generator instance
+_COMPILED_TEMPLATES = MappingProxyType(
+    {name: CompiledTemplate(source) for name, source in _TEMPLATES.items()}
+)
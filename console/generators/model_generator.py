@@ -88,15 +88,14 @@ class ModelGenerator(BaseGenerator):
         migration_gen = MigrationGenerator()
         table_name = options.get('table', self.get_table_name(self.get_class_name(name)))
         
-        migration_options = {
-            'create': True,
-            'table': table_name,
-            'fields': options.get('fields', []),
-            'force': options.get('force', False)
-        }
-        
         migration_name = f"create_{table_name}_table"
-        return migration_gen.generate(migration_name, **migration_options)
+        return migration_gen.generate(
+            migration_name,
+            create=True,
+            table=table_name,
+            fields=options.get('fields', []),
+            force=options.get('force', False)
+        )
     
     def _generate_factory(self, name: str, **options) -> bool:
         """Generate factory for the model."""
@@ -119,14 +118,13 @@ class ModelGenerator(BaseGenerator):
         controller_gen = ControllerGenerator()
         controller_name = f"{name}Controller"
         
-        controller_options = {
-            'resource': resource,
-            'api': api,
-            'model': name,
-            'force': options.get('force', False)
-        }
-        
-        return controller_gen.generate(controller_name, **controller_options)
+        return controller_gen.generate(
+            controller_name,
+            resource=resource,
+            api=api,
+            model=name,
+            force=options.get('force', False)
+        )
     
     def _format_fillable(self, fillable: List[str]) -> str:
         """Format fillable array for template."""
@@ -237,15 +235,18 @@ class {{class_name}}(Model):
     hidden = {{hidden}}
     
     # Attribute casting
-    casts = {{casts}}{{relationships}}
+    casts = {{casts}}
+    
+    # Format shared by __str__ and __repr__, parsed once with the class
+    _REPR_FMT = "{{class_name}}({})"{{relationships}}
     
     def __str__(self):
         """String representation of the model."""
-        return f"{{class_name}}({{self.get_key()}})"
+        return self._REPR_FMT.format(self.get_key())
     
     def __repr__(self):
         """Detailed string representation."""
-        return f"{{class_name}}({{dict(self.attributes)}})"
+        return self._REPR_FMT.format(dict(self.attributes))
 '''
 
         self.templates['pivot_model'] = '''"""
@@ -280,7 +281,10 @@ class {{class_name}}(Pivot):
     # Attribute casting
     casts = {{casts}}
     
+    # Format used by __str__, parsed once with the class
+    _REPR_FMT = "{{class_name}}({})"
+    
     def __str__(self):
         """String representation of the pivot model."""
-        return f"{{class_name}}({{self.get_key()}})"
+        return self._REPR_FMT.format(self.get_key())
 '''
\ No newline at end of file
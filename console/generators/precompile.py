@@ -0,0 +1,54 @@
+"""
+Template Precompiler
+
+Compiles the Jinja2 templates used by the code generators into Python modules
+ahead of time, so generators load them instead of parsing template source.
+
+Usage:
+    python -m larapy.console.generators.precompile [TARGET_DIR]
+"""
+
+import os
+import sys
+from typing import List, Optional
+from jinja2 import DictLoader, Environment
+from .templating import COMPILED_TEMPLATES_DIR, registered_sources
+
+# Generator modules that register Jinja2 templates at import time
+from . import controller_generator  # noqa: F401
+
+
+def precompile(target: Optional[str] = None) -> List[str]:
+    """
+    Compile every registered generator template into ``target``.
+    
+    Args:
+        target: Output directory (defaults to the generators' compiled
+            templates directory)
+    
+    Returns:
+        Names of the compiled templates
+    """
+    target = target or COMPILED_TEMPLATES_DIR
+    sources = registered_sources()
+    
+    os.makedirs(target, exist_ok=True)
+    env = Environment(loader=DictLoader(sources), autoescape=False)
+    env.compile_templates(target, zip=None, ignore_errors=False)
+    
+    return sorted(sources)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the precompiler from the command line."""
+    argv = sys.argv[1:] if argv is None else argv
+    target = argv[0] if argv else None
+    
+    for name in precompile(target):
+        print(f"Compiled {name}")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
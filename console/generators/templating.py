@@ -0,0 +1,75 @@
+"""
+Generator Templating
+
+Shared Jinja2 environment for generator templates. Templates are loaded from
+ahead-of-time compiled modules when ``python -m
+larapy.console.generators.precompile`` has been run, and compiled from source
+otherwise.
+"""
+
+import hashlib
+import os
+from typing import Dict
+from jinja2 import Environment, ModuleLoader, Template, TemplateNotFound
+
+
+# Directory holding the modules written by the precompile command
+COMPILED_TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), '_compiled_templates')
+
+# Template sources registered by the generator modules, keyed by compiled name
+_SOURCES: Dict[str, str] = {}
+
+_ENV = Environment(
+    loader=ModuleLoader(COMPILED_TEMPLATES_DIR),
+    autoescape=False,
+    auto_reload=False,
+    cache_size=-1
+)
+
+
+def compiled_name(name: str, source: str) -> str:
+    """
+    Get the name a template is compiled under.
+    
+    The name includes a hash of the source, so a stale compiled module is
+    never picked up after the template changes.
+    
+    Args:
+        name: Template name
+        source: Template source
+    
+    Returns:
+        Compiled template name
+    """
+    digest = hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]
+    return f"{name}_{digest}"
+
+
+def compile_template(name: str, source: str) -> Template:
+    """
+    Get a compiled Jinja2 template, preferring the precompiled module.
+    
+    Args:
+        name: Template name
+        source: Template source
+    
+    Returns:
+        Compiled template
+    """
+    key = compiled_name(name, source)
+    _SOURCES[key] = source
+    
+    try:
+        return _ENV.get_template(key)
+    except TemplateNotFound:
+        return _ENV.from_string(source)
+
+
+def registered_sources() -> Dict[str, str]:
+    """
+    Get the sources of all templates registered so far.
+    
+    Returns:
+        Dictionary of compiled name to template source
+    """
+    return dict(_SOURCES)
@@ -5,11 +5,28 @@ This module provides Laravel-like dependency injection container functionality.
 """
 
 import inspect
-from typing import Any, Dict, Type, Callable, Optional, TypeVar, Union
-from threading import RLock
+import sys
+from typing import Any, Dict, List, Type, Callable, Optional, Tuple, TypeVar, Union
+
+try:
+    # C-level reentrant lock, much cheaper to acquire when uncontended
+    from fastrlock.rlock import FastRLock as RLock
+except ImportError:
+    from threading import RLock
 
 T = TypeVar('T')
 
+# A resolution plan entry: (parameter name, annotation lookup key or None, has default)
+_PlanEntry = Tuple[str, Optional[str], bool]
+
+# Marks a class whose resolution plan has not been built yet
+_NO_PLAN = object()
+
+
+def _intern(abstract: Any) -> Any:
+    """Intern string keys so container lookups can match them by identity."""
+    return sys.intern(abstract) if type(abstract) is str else abstract
+
 
 class BindingResolutionException(Exception):
     """Exception raised when a binding cannot be resolved."""
@@ -28,6 +45,8 @@ class Container:
         self._bindings: Dict[str, Dict[str, Any]] = {}
         self._instances: Dict[str, Any] = {}
         self._aliases: Dict[str, str] = {}
+        self._alias_targets: Dict[str, str] = {}
+        self._resolution_plans: Dict[type, Optional[List[_PlanEntry]]] = {}
         self._lock = RLock()
         
     def bind(self, abstract: str, concrete: Union[Type, Callable, str, None] = None, 
@@ -40,6 +59,8 @@ class Container:
             concrete: The concrete implementation
             shared: Whether the binding should be singleton
         """
+        abstract = _intern(abstract)
+        
         with self._lock:
             if concrete is None:
                 concrete = abstract
@@ -52,6 +73,8 @@ class Container:
             # Remove existing instance if re-binding
             if abstract in self._instances:
                 del self._instances[abstract]
+            
+            self._resolution_plans.clear()
     
     def singleton(self, abstract: str, concrete: Union[Type, Callable, str, None] = None) -> None:
         """
@@ -74,6 +97,8 @@ class Container:
         Returns:
             The registered instance
         """
+        abstract = _intern(abstract)
+        
         with self._lock:
             self._instances[abstract] = instance
             return instance
@@ -82,12 +107,45 @@ class Container:
         """
         Alias an abstract type to another name.
         
+        Aliases are stored as registered (one hop each), and a flattened view
+        mapping every alias to its terminal abstract is rebuilt here, so
+        resolution needs a single lookup and re-pointing an alias in the
+        middle of a chain is seen by every alias that leads through it.
+        
         Args:
             abstract: The abstract type
             alias: The alias name
         """
+        abstract = _intern(abstract)
+        alias = _intern(alias)
+        
         with self._lock:
+            if alias == abstract:
+                return
+            
             self._aliases[alias] = abstract
+            self._alias_targets = self._flatten_aliases()
+    
+    def _flatten_aliases(self) -> Dict[str, str]:
+        """
+        Map every alias to the terminal abstract its chain leads to.
+        
+        Returns:
+            Dictionary of alias to terminal abstract
+        """
+        aliases = self._aliases
+        targets = {}
+        for name, target in aliases.items():
+            seen = {name}
+            # Follow the chain, stopping before any cycle repeats
+            while target in aliases and target not in seen:
+                seen.add(target)
+                next_target = aliases[target]
+                if next_target in seen:
+                    break
+                target = next_target
+            targets[name] = target
+        return targets
     
     def make(self, abstract: str, parameters: Optional[Dict[str, Any]] = None) -> Any:
         """
@@ -103,6 +161,13 @@ class Container:
         Raises:
             BindingResolutionException: If the binding cannot be resolved
         """
+        # Already-resolved shared instances are read without taking the lock;
+        # dict lookups are atomic and the lock still guards publication
+        if not parameters:
+            instance = self._instances.get(self._alias_targets.get(abstract, abstract))
+            if instance is not None:
+                return instance
+        
         return self._resolve(abstract, parameters or {})
     
     def resolve(self, abstract: str, parameters: Optional[Dict[str, Any]] = None) -> Any:
@@ -143,10 +208,16 @@ class Container:
         Returns:
             The resolved instance
         """
+        # Check for alias
+        abstract = self._get_alias(abstract)
+        
+        # Transient bindings build a fresh object and publish nothing, so they
+        # are resolved outside the lock and concurrent callers don't serialize
+        binding = self._bindings.get(abstract)
+        if binding is not None and not binding['shared'] and abstract not in self._instances:
+            return self._build(abstract, parameters, binding)
+        
         with self._lock:
-            # Check for alias
-            abstract = self._get_alias(abstract)
-            
             # Check for existing instance
             if abstract in self._instances:
                 return self._instances[abstract]
@@ -172,18 +243,21 @@ class Container:
             
             raise BindingResolutionException(f"Unable to resolve [{abstract}] from container")
     
-    def _build(self, abstract: str, parameters: Dict[str, Any]) -> Any:
+    def _build(self, abstract: str, parameters: Dict[str, Any],
+               binding: Optional[Dict[str, Any]] = None) -> Any:
         """
         Build an instance from a binding.
         
         Args:
             abstract: The abstract type
             parameters: Parameters for building
+            binding: The binding already looked up by the caller, if any
             
         Returns:
             The built instance
         """
-        binding = self._bindings[abstract]
+        if binding is None:
+            binding = self._bindings[abstract]
         concrete = binding['concrete']
         
         # Build the instance
@@ -214,41 +288,79 @@ class Container:
         Returns:
             The built instance
         """
-        # Get constructor signature
-        try:
-            signature = inspect.signature(cls.__init__)
-        except (ValueError, TypeError):
+        plan = self._resolution_plans.get(cls, _NO_PLAN)
+        if plan is _NO_PLAN:
+            plan = self._resolution_plans[cls] = self._build_resolution_plan(cls)
+        
+        if plan is None:
             # No constructor or can't inspect, try without parameters
             return cls()
         
         # Build dependencies
         dependencies = {}
-        for name, param in signature.parameters.items():
-            if name == 'self':
-                continue
-                
+        for name, key, has_default in plan:
             # Use provided parameter if available
             if name in parameters:
                 dependencies[name] = parameters[name]
                 continue
             
             # Try to resolve from type annotation
-            if param.annotation != inspect.Parameter.empty:
+            if key is not None:
+                if has_default:
+                    # An unbound name without a module path can only fail to
+                    # resolve, so fall back to the default without raising
+                    target = self._alias_targets.get(key, key)
+                    if (target not in self._instances and target not in self._bindings
+                            and '.' not in target):
+                        continue
+                
                 try:
-                    annotation = param.annotation
-                    if hasattr(annotation, '__name__'):
-                        dependencies[name] = self._resolve(annotation.__name__, {})
-                    else:
-                        dependencies[name] = self._resolve(str(annotation), {})
+                    dependencies[name] = self._resolve(key, {})
                 except BindingResolutionException:
                     # Can't resolve, check if parameter has default
-                    if param.default == inspect.Parameter.empty:
+                    if not has_default:
                         raise BindingResolutionException(
                             f"Unable to resolve parameter [{name}] for class [{cls.__name__}]"
                         )
         
         return cls(**dependencies)
     
+    def _build_resolution_plan(self, cls: type) -> Optional[List[_PlanEntry]]:
+        """
+        Inspect a class constructor once and record how to resolve its parameters.
+        
+        Args:
+            cls: The class to inspect
+            
+        Returns:
+            List of (name, lookup key, has default) entries, or None if the
+            class should be built without arguments
+        """
+        if cls.__init__ is object.__init__:
+            return None
+        
+        try:
+            signature = inspect.signature(cls.__init__)
+        except (ValueError, TypeError):
+            return None
+        
+        plan = []
+        for name, param in signature.parameters.items():
+            if name == 'self':
+                continue
+            
+            annotation = param.annotation
+            if annotation is inspect.Parameter.empty:
+                key = None
+            elif hasattr(annotation, '__name__'):
+                key = _intern(annotation.__name__)
+            else:
+                key = _intern(str(annotation))
+            
+            plan.append((name, key, param.default is not inspect.Parameter.empty))
+        
+        return plan
+    
     def _get_alias(self, abstract: str) -> str:
         """
         Get the alias for an abstract type.
@@ -259,7 +371,7 @@ class Container:
         Returns:
             The resolved alias or original abstract
         """
-        return self._aliases.get(abstract, abstract)
+        return self._alias_targets.get(abstract, abstract)
     
     def flush(self) -> None:
         """
@@ -269,6 +381,8 @@ class Container:
             self._bindings.clear()
             self._instances.clear()
             self._aliases.clear()
+            self._alias_targets = {}
+            self._resolution_plans.clear()
     
     def __contains__(self, abstract: str) -> bool:
         """
@@ -150,12 +150,16 @@ class Migrator:
         if self.database_type == 'sqlite' and hasattr(self, 'database_path'):
             Path(self.database_path).parent.mkdir(parents=True, exist_ok=True)
         
+        # SQLite connection reused across queries (opened lazily)
+        self._sqlite_connection: Optional[sqlite3.Connection] = None
+        
     def get_connection(self):
         """Get database connection."""
         if self.database_type == 'sqlite':
-            conn = sqlite3.connect(self.database_path)
-            conn.row_factory = sqlite3.Row
-            return conn
+            if self._sqlite_connection is None:
+                self._sqlite_connection = sqlite3.connect(self.database_path)
+                self._sqlite_connection.row_factory = sqlite3.Row
+            return self._sqlite_connection
         elif self.database_type == 'mysql':
             import mysql.connector
             return mysql.connector.connect(
@@ -169,6 +173,12 @@ class Migrator:
         else:
             raise ValueError(f"Unsupported database type: {self.database_type}")
     
+    def close(self) -> None:
+        """Close the shared SQLite connection, if one was opened."""
+        if self._sqlite_connection is not None:
+            self._sqlite_connection.close()
+            self._sqlite_connection = None
+    
     def _execute_query(self, query: str, params: tuple = (), fetch: str = None):
         """Execute a database query with proper handling for different database types."""
         with self.get_connection() as conn:
@@ -66,6 +66,11 @@ class QueryBuilder:
                 value = operator
                 operator = '='
             
+            if isinstance(value, list):
+                # Snapshot list values so later changes by the caller can't
+                # alter the query (or its memoized cache key)
+                value = tuple(value)
+            
             self._where_clauses.append((column, operator, value))
         return self
         
@@ -83,12 +88,12 @@ class QueryBuilder:
         
     def where_in(self, column: str, values: List[Any]) -> 'QueryBuilder':
         """Add a WHERE IN clause."""
-        self._where_clauses.append((column, 'IN', values))
+        self._where_clauses.append((column, 'IN', tuple(values)))
         return self
         
     def where_not_in(self, column: str, values: List[Any]) -> 'QueryBuilder':
         """Add a WHERE NOT IN clause."""
-        self._where_clauses.append((column, 'NOT IN', values))
+        self._where_clauses.append((column, 'NOT IN', tuple(values)))
         return self
         
     def where_null(self, column: str) -> 'QueryBuilder':
@@ -6,13 +6,31 @@ database performance by caching frequently executed queries.
 """
 
 import hashlib
+import heapq
 import json
+import math
+import os
 import pickle
+import shutil
+import struct
 import time
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 
+try:
+    # Non-cryptographic and much faster than MD5 for short cache keys
+    from xxhash import xxh3_64_hexdigest as _hash_key
+except ImportError:
+    def _hash_key(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class QueryCache(ABC):
     """Abstract base class for query caching implementations."""
@@ -43,61 +61,200 @@ class QueryCache(ABC):
         pass
 
 
+# Number of puts between sweeps of expired MemoryQueryCache entries
+_EXPIRY_SWEEP_INTERVAL = 64
+
+# Maximum number of released MemoryQueryCache entries kept for reuse
+_ENTRY_POOL_SIZE = 256
+
+
+# FileQueryCache entries start with their expiry time and payload format, so
+# freshness checks read only this header and skip decoding the value;
+# infinity means no expiry
+_ENTRY_HEADER = struct.Struct('<dc')
+_FORMAT_PICKLE = b'p'
+_FORMAT_JSON = b'j'
+
+# Value types that survive a JSON round trip unchanged (floats only if finite)
+_JSON_SCALARS = frozenset((str, int, bool, type(None)))
+
+
+def _is_json_native(value: Any) -> bool:
+    """Check whether a value is built only from JSON-native types."""
+    value_type = type(value)
+    if value_type in _JSON_SCALARS:
+        return True
+    if value_type is float:
+        # orjson writes NaN and infinities as null
+        return math.isfinite(value)
+    if value_type is list:
+        return all(map(_is_json_native, value))
+    if value_type is dict:
+        return all(map(_is_json_native, value.values()))
+    return False
+
+
+class _Entry:
+    """Compact in-memory cache entry record."""
+    
+    __slots__ = ('value', 'expires_at', 'created_at')
+    
+    def __init__(self, value: Any = None, expires_at: Optional[float] = None, created_at: float = 0.0):
+        self.value = value
+        self.expires_at = expires_at
+        self.created_at = created_at
+
+
 class MemoryQueryCache(QueryCache):
     """In-memory query cache implementation."""
     
-    def __init__(self, default_ttl: int = 3600):
-        self.cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, default_ttl: int = 3600, max_size: Optional[int] = 10000):
+        # Ordered least to most recently used; None disables the size bound
+        self.cache: 'OrderedDict[str, _Entry]' = OrderedDict()
         self.default_ttl = default_ttl
+        self.max_size = max_size
+        
+        # (expires_at, key) pairs, so expired entries are dropped even if never read
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._puts_since_sweep = 0
+        
+        # Released entry records, recycled by put to cut allocation under churn
+        self._entry_pool: List[_Entry] = []
+        
+        # Called with the key of every entry the cache drops on its own
+        # (LRU eviction or expiry), so owners can clean up their indexes
+        self.on_evict: Optional[Callable[[str], None]] = None
         
     async def get(self, key: str) -> Optional[Any]:
         """Get cached value by key."""
-        if key in self.cache:
-            entry = self.cache[key]
-            if self._is_expired(entry):
-                del self.cache[key]
-                return None
-            return entry['value']
-        return None
+        return self.get_sync(key)
         
     async def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Store value in cache with optional TTL."""
-        ttl = ttl or self.default_ttl
-        expires_at = time.time() + ttl if ttl > 0 else None
-        
-        self.cache[key] = {
-            'value': value,
-            'expires_at': expires_at,
-            'created_at': time.time()
-        }
+        self.put_sync(key, value, ttl)
         
     async def forget(self, key: str) -> bool:
         """Remove value from cache."""
-        if key in self.cache:
-            del self.cache[key]
-            return True
-        return False
+        return self.forget_sync(key)
         
     async def flush(self) -> bool:
         """Clear all cached values."""
         self.cache.clear()
+        self._expiry_heap.clear()
         return True
         
     async def has(self, key: str) -> bool:
         """Check if key exists in cache."""
-        if key in self.cache:
-            entry = self.cache[key]
-            if self._is_expired(entry):
-                del self.cache[key]
-                return False
-            return True
-        return False
+        return self.has_sync(key)
+        
+    # The cache does no I/O, so these synchronous variants let hot paths skip
+    # the coroutine and event loop overhead of the async interface
+    
+    def get_sync(self, key: str) -> Optional[Any]:
+        """Get cached value by key without awaiting."""
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at = entry.expires_at
+        if expires_at is not None and time.time() > expires_at:
+            del self.cache[key]
+            self._evicted(key, entry)
+            return None
+        
+        self.cache.move_to_end(key)
+        return entry.value
+        
+    def put_sync(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store value in cache with optional TTL without awaiting."""
+        ttl = ttl or self.default_ttl
+        now = time.time()
+        expires_at = now + ttl if ttl > 0 else None
+        
+        cache = self.cache
+        entry = cache.get(key)
+        if entry is not None:
+            # Re-put: update the existing record in place
+            cache.move_to_end(key)
+        else:
+            if self.max_size is not None and len(cache) >= self.max_size:
+                # Evict the least recently used entry
+                self._evicted(*cache.popitem(last=False))
+            entry = self._entry_pool.pop() if self._entry_pool else _Entry()
+            cache[key] = entry
+        
+        entry.value = value
+        entry.expires_at = expires_at
+        entry.created_at = now
+        
+        if expires_at is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, key))
+        
+        self._puts_since_sweep += 1
+        if self._puts_since_sweep >= _EXPIRY_SWEEP_INTERVAL:
+            self._sweep_expired(now)
+        
+    def forget_sync(self, key: str) -> bool:
+        """Remove value from cache without awaiting."""
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            return False
+        self._release(entry)
+        return True
+        
+    def has_sync(self, key: str) -> bool:
+        """Check if key exists in cache without awaiting."""
+        entry = self.cache.get(key)
+        if entry is None:
+            return False
+        
+        expires_at = entry.expires_at
+        if expires_at is not None and time.time() > expires_at:
+            del self.cache[key]
+            self._evicted(key, entry)
+            return False
+        return True
         
-    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+    def _sweep_expired(self, now: float) -> None:
+        """Remove every entry whose expiry time has passed."""
+        self._puts_since_sweep = 0
+        heap = self._expiry_heap
+        cache = self.cache
+        
+        while heap and heap[0][0] <= now:
+            _, key = heapq.heappop(heap)
+            entry = cache.get(key)
+            # The key may have been re-put with a later expiry since
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= now:
+                del cache[key]
+                self._evicted(key, entry)
+        
+        # Re-putting keys leaves stale heap items behind; rebuild once they dominate
+        if len(heap) > 2 * len(cache) + _EXPIRY_SWEEP_INTERVAL:
+            self._expiry_heap = [
+                (entry.expires_at, key)
+                for key, entry in cache.items()
+                if entry.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+        
+    def _evicted(self, key: str, entry: _Entry) -> None:
+        """Recycle an entry the cache dropped on its own and report its key."""
+        self._release(entry)
+        if self.on_evict is not None:
+            self.on_evict(key)
+        
+    def _release(self, entry: _Entry) -> None:
+        """Return a removed entry record to the pool for reuse."""
+        if len(self._entry_pool) < _ENTRY_POOL_SIZE:
+            entry.value = None  # Don't keep the cached value alive
+            self._entry_pool.append(entry)
+        
+    def _is_expired(self, entry: _Entry) -> bool:
         """Check if cache entry is expired."""
-        if entry['expires_at'] is None:
+        if entry.expires_at is None:
             return False
-        return time.time() > entry['expires_at']
+        return time.time() > entry.expires_at
 
 
 class FileQueryCache(QueryCache):
@@ -108,7 +265,6 @@ class FileQueryCache(QueryCache):
         self.default_ttl = default_ttl
         
         # Ensure cache directory exists
-        import os
         os.makedirs(cache_dir, exist_ok=True)
         
     async def get(self, key: str) -> Optional[Any]:
@@ -116,36 +272,40 @@ class FileQueryCache(QueryCache):
         file_path = self._get_file_path(key)
         
         try:
-            import os
-            if not os.path.exists(file_path):
-                return None
-                
             with open(file_path, 'rb') as f:
-                data = pickle.load(f)
-                
-            if self._is_expired(data):
-                os.unlink(file_path)
-                return None
+                expires_at, payload_format = self._read_header(f)
+                if not self._is_expired(expires_at):
+                    if payload_format == _FORMAT_JSON:
+                        return (orjson or json).loads(f.read())
+                    return pickle.load(f)
                 
-            return data['value']
-        except (FileNotFoundError, pickle.PickleError, KeyError):
+            os.unlink(file_path)
+            return None
+        except (OSError, pickle.PickleError, struct.error, EOFError, ValueError):
             return None
             
     async def put(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Store value in cache with optional TTL."""
         ttl = ttl or self.default_ttl
-        expires_at = time.time() + ttl if ttl > 0 else None
+        expires_at = time.time() + ttl if ttl > 0 else float('inf')
         
         file_path = self._get_file_path(key)
-        data = {
-            'value': value,
-            'expires_at': expires_at,
-            'created_at': time.time()
-        }
         
         try:
-            with open(file_path, 'wb') as f:
-                pickle.dump(data, f)
+            data = self._serialize(expires_at, value)
+            
+            # Write to a private temporary file and rename it into place, so
+            # readers never see a partially written entry. Mode 0666 lets the
+            # umask decide permissions, as a plain open() would
+            tmp_path = f"{file_path}.{os.urandom(6).hex()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
         except (pickle.PickleError, IOError):
             pass  # Silently fail caching
             
@@ -153,7 +313,6 @@ class FileQueryCache(QueryCache):
         """Remove value from cache."""
         file_path = self._get_file_path(key)
         try:
-            import os
             if os.path.exists(file_path):
                 os.unlink(file_path)
                 return True
@@ -164,8 +323,6 @@ class FileQueryCache(QueryCache):
     async def flush(self) -> bool:
         """Clear all cached values."""
         try:
-            import os
-            import shutil
             if os.path.exists(self.cache_dir):
                 shutil.rmtree(self.cache_dir)
                 os.makedirs(self.cache_dir, exist_ok=True)
@@ -173,37 +330,67 @@ class FileQueryCache(QueryCache):
         except OSError:
             return False
             
+    async def flush_expired(self) -> int:
+        """Remove expired entries and return how many were removed."""
+        now = time.time()
+        count = 0
+        
+        # scandir yields cached file types, and only each entry's header is read
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.cache') or not entry.is_file(follow_symlinks=False):
+                        continue
+                    
+                    try:
+                        with open(entry.path, 'rb') as f:
+                            expires_at = self._read_header(f)[0]
+                        if expires_at < now:
+                            os.unlink(entry.path)
+                            count += 1
+                    except (OSError, struct.error):
+                        continue
+        except OSError:
+            pass
+        
+        return count
+        
     async def has(self, key: str) -> bool:
         """Check if key exists in cache."""
         file_path = self._get_file_path(key)
         
         try:
-            import os
-            if not os.path.exists(file_path):
-                return False
-                
             with open(file_path, 'rb') as f:
-                data = pickle.load(f)
-                
-            if self._is_expired(data):
-                os.unlink(file_path)
-                return False
+                if not self._is_expired(self._read_header(f)[0]):
+                    return True
                 
-            return True
-        except (FileNotFoundError, pickle.PickleError, KeyError):
+            os.unlink(file_path)
+            return False
+        except (OSError, struct.error):
             return False
             
     def _get_file_path(self, key: str) -> str:
         """Get file path for cache key."""
-        import os
-        safe_key = hashlib.md5(key.encode()).hexdigest()
+        safe_key = _hash_key(key.encode())
         return os.path.join(self.cache_dir, f"{safe_key}.cache")
         
-    def _is_expired(self, data: Dict[str, Any]) -> bool:
+    def _serialize(self, expires_at: float, value: Any) -> bytes:
+        """Encode a cache entry, using orjson for JSON-native values."""
+        if orjson is not None and _is_json_native(value):
+            try:
+                return _ENTRY_HEADER.pack(expires_at, _FORMAT_JSON) + orjson.dumps(value)
+            except orjson.JSONEncodeError:
+                pass  # e.g. integers beyond 64 bits or non-string keys
+        
+        return _ENTRY_HEADER.pack(expires_at, _FORMAT_PICKLE) + pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        
+    def _read_header(self, f) -> Tuple[float, bytes]:
+        """Read the expiry time and payload format of an open cache file."""
+        return _ENTRY_HEADER.unpack(f.read(_ENTRY_HEADER.size))
+        
+    def _is_expired(self, expires_at: float) -> bool:
         """Check if cache entry is expired."""
-        if data['expires_at'] is None:
-            return False
-        return time.time() > data['expires_at']
+        return time.time() > expires_at
 
 
 class CacheableQueryBuilder:
@@ -214,6 +401,8 @@ class CacheableQueryBuilder:
         self._cache_ttl = None
         self._cache_tags = []
         self._cache_key = None
+        self._generated_cache_key: Optional[str] = None
+        self._generated_cache_key_state: Optional[tuple] = None
         
     def cache(self, ttl: Optional[int] = None, tags: Optional[List[str]] = None) -> 'CacheableQueryBuilder':
         """Enable caching for this query."""
@@ -252,23 +441,43 @@ class CacheableQueryBuilder:
         """Generate cache key from query parameters."""
         if self._cache_key:
             return self._cache_key
+        
+        # Builder methods only append to the clause lists or replace the scalar
+        # settings, and they snapshot list values (where_in etc.) as tuples, so
+        # this fingerprint changes whenever the query does
+        state = (
+            self.table_name,
+            len(self._select_columns),
+            len(self._where_clauses),
+            len(self._joins),
+            len(self._group_by),
+            len(self._having),
+            len(self._order_by),
+            self._limit_count,
+            self._offset_count
+        )
+        if self._generated_cache_key is not None and state == self._generated_cache_key_state:
+            return self._generated_cache_key
             
-        # Create key from query components
-        key_components = {
-            'table': self.table_name,
-            'select': self._select_columns,
-            'where': self._where_clauses,
-            'joins': self._joins,
-            'group_by': self._group_by,
-            'having': self._having,
-            'order_by': self._order_by,
-            'limit': self._limit_count,
-            'offset': self._offset_count
-        }
+        # Create key from query components; the clause lists hold tuples of
+        # primitives, so their repr is already a canonical, deterministic form
+        key_components = (
+            self.table_name,
+            self._select_columns,
+            self._where_clauses,
+            self._joins,
+            self._group_by,
+            self._having,
+            self._order_by,
+            self._limit_count,
+            self._offset_count
+        )
         
         # Serialize and hash
-        key_string = json.dumps(key_components, sort_keys=True)
-        return f"query:{hashlib.md5(key_string.encode()).hexdigest()}"
+        key_string = repr(key_components)
+        self._generated_cache_key = f"query:{_hash_key(key_string.encode())}"
+        self._generated_cache_key_state = state
+        return self._generated_cache_key
         
     async def _get_cached_result(self, cache: QueryCache, cache_key: str) -> Optional[Any]:
         """Get result from cache."""
@@ -288,43 +497,69 @@ class QueryCacheManager:
     
     def __init__(self, cache: QueryCache):
         self.cache = cache
-        self._tag_mappings: Dict[str, List[str]] = {}
+        # Tag -> keys, and the reverse key -> tags index, so tagging and
+        # untagging a key cost O(1) per tag
+        self._tag_mappings: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Set[str]] = {}
+        
+        # In-memory caches are served synchronously, without awaiting the cache
+        self._memory_cache: Optional[MemoryQueryCache] = (
+            cache if isinstance(cache, MemoryQueryCache) else None
+        )
+        
+        # Keep the tag index in step with entries the cache evicts by itself
+        if self._memory_cache is not None:
+            self._memory_cache.on_evict = self._untag
         
     async def get(self, key: str) -> Optional[Any]:
         """Get cached query result."""
+        if self._memory_cache is not None:
+            return self._memory_cache.get_sync(key)
         return await self.cache.get(key)
         
+    def get_nowait(self, key: str) -> Optional[Any]:
+        """
+        Get a cached query result without awaiting.
+        
+        Only available when the manager wraps a MemoryQueryCache.
+        """
+        if self._memory_cache is None:
+            raise TypeError("get_nowait() requires a MemoryQueryCache")
+        return self._memory_cache.get_sync(key)
+        
     async def put(self, key: str, result: Any, ttl: Optional[int] = None, 
                  tags: Optional[List[str]] = None) -> None:
         """Cache query result."""
-        await self.cache.put(key, result, ttl)
+        if self._memory_cache is not None:
+            self._memory_cache.put_sync(key, result, ttl)
+        else:
+            await self.cache.put(key, result, ttl)
         
         # Store tag mappings
         if tags:
+            key_tags = self._key_tags.setdefault(key, set())
             for tag in tags:
-                if tag not in self._tag_mappings:
-                    self._tag_mappings[tag] = []
-                if key not in self._tag_mappings[tag]:
-                    self._tag_mappings[tag].append(key)
+                self._tag_mappings.setdefault(tag, set()).add(key)
+                key_tags.add(tag)
                     
     async def forget(self, key: str) -> bool:
         """Remove cached query result."""
+        self._untag(key)
+        if self._memory_cache is not None:
+            return self._memory_cache.forget_sync(key)
         return await self.cache.forget(key)
         
     async def flush_tag(self, tag: str) -> int:
         """Remove all cached results with the specified tag."""
-        if tag not in self._tag_mappings:
+        keys = self._tag_mappings.pop(tag, None)
+        if not keys:
             return 0
             
-        keys = self._tag_mappings[tag]
         count = 0
-        
         for key in keys:
-            if await self.cache.forget(key):
+            if await self.forget(key):
                 count += 1
                 
-        # Clean up tag mapping
-        del self._tag_mappings[tag]
         return count
         
     async def flush_tags(self, tags: List[str]) -> int:
@@ -337,11 +572,23 @@ class QueryCacheManager:
     async def flush(self) -> bool:
         """Clear all cached query results."""
         self._tag_mappings.clear()
+        self._key_tags.clear()
         return await self.cache.flush()
         
     async def has(self, key: str) -> bool:
         """Check if query result is cached."""
+        if self._memory_cache is not None:
+            return self._memory_cache.has_sync(key)
         return await self.cache.has(key)
+        
+    def _untag(self, key: str) -> None:
+        """Remove a key from the index of every tag it was stored under."""
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_mappings.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_mappings[tag]
 
 
 # Enhanced QueryBuilder with caching (this would be integrated into the main QueryBuilder)
@@ -106,12 +106,14 @@ class Schema:
         """Check if all specified columns exist in a table."""
         from larapy.core.application import app
         
+        if not columns:
+            return True
+        
         schema = cls(app.make('db'))
         
-        for column in columns:
-            if not asyncio.run(schema._column_exists(table_name, column, connection)):
-                return False
-        return True
+        # Fetch the column listing once rather than once per column
+        existing = frozenset(asyncio.run(schema._get_columns(table_name, connection)))
+        return existing.issuperset(columns)
     
     @classmethod
     def get_column_type(cls, table_name: str, column_name: str,
@@ -0,0 +1,44 @@
+"""
+CLI import footprint tests.
+
+Importing the CLI must not pull in the framework: help and shell completion
+stay fast only while the heavy packages are imported lazily.
+"""
+
+import importlib.util
+import subprocess
+import sys
+
+import pytest
+
+
+# Module prefixes that must stay out of sys.modules after importing the CLI
+FORBIDDEN_PREFIXES = (
+    'larapy.http',
+    'larapy.database',
+    'larapy.core',
+    'starlette',
+    'sqlalchemy',
+)
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec('larapy') is None,
+    reason="larapy must be installed (pip install -e .)"
+)
+def test_importing_cli_does_not_load_framework_modules():
+    """Importing larapy.console.cli loads none of the heavy framework modules."""
+    result = subprocess.run(
+        [sys.executable, '-c',
+         'import larapy.console.cli, sys; print("\\n".join(sorted(sys.modules)))'],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    
+    loaded = [
+        module for module in result.stdout.splitlines()
+        if module.startswith(FORBIDDEN_PREFIXES)
+    ]
+    
+    assert loaded == []